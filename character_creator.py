@@ -16,11 +16,12 @@
 #   - Graphics/json path changes are handled elsewhere; this file does not read graphics.json.
 # ------------------------------------------------------------
 
-import os
+import sys
 from typing import Dict, List, Optional
 import logging
 from colorama import Fore, Style
 
+from dnd_adventure.console_utils import clear_screen
 from dnd_adventure.race_selector import select_race
 from dnd_adventure.class_selector import select_class
 from dnd_adventure.stat_roller import roll_stats   # Your existing stats logic (manual/random) lives here
@@ -32,14 +33,87 @@ from dnd_adventure.race_models import Race  # Dataclass/model for races
 
 logger = logging.getLogger(__name__)
 
+_SEPARATOR = f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}"
+_MENU_PROMPT = f"\n{Fore.CYAN}Enter number (or 'q' to quit): {Style.RESET_ALL}"
+_BAD_INPUT_MSG = f"{Fore.RED}Invalid input. Please enter a number or 'q'.{Style.RESET_ALL}"
+
+# Lightweight flavor text for the Cleric domain menu.
+_DOMAIN_DESCRIPTIONS: Dict[str, str] = {
+    "Air": "Masters of wind and storms, wielding tempestuous magic.",
+    "Death": "Commanders of necromantic energies and the undead.",
+    "Healing": "Restorers of life and vitality through divine power.",
+    "War": "Champions of battle, blessed with martial prowess.",
+}
 
-def _clear_screen() -> None:
-    """Cross-platform terminal clear to keep the UI readable."""
-    try:
-        os.system('cls' if os.name == 'nt' else 'clear')
-    except Exception:
-        # Not fatal; if clear fails, continue without it.
-        pass
+
+def _show_menu(rendered: str) -> None:
+    """Clear the screen and draw a pre-rendered menu with a single write."""
+    clear_screen()
+    sys.stdout.write(rendered)
+    sys.stdout.flush()
+
+
+def _prompt_menu_choice(n: int, step: str) -> int:
+    """
+    Prompt until the player enters a number in 1..n and return it as a 0-based index.
+    The menu is not redrawn; invalid input prints an error under it and re-prompts.
+    Raises:
+        SystemExit (graceful), if the player enters 'q'.
+    """
+    out_of_range = f"{Fore.RED}Invalid choice. Please select a number between 1 and {n}.{Style.RESET_ALL}"
+    while True:
+        try:
+            choice = input(_MENU_PROMPT).strip().lower()
+            if choice == 'q':
+                logger.info("Game exited during %s selection", step)
+                raise SystemExit(f"{step.capitalize()} selection cancelled")
+            idx = int(choice) - 1
+            if 0 <= idx < n:
+                return idx
+            print(out_of_range)
+        except ValueError:
+            print(_BAD_INPUT_MSG)
+
+
+def _build_menu(subrace_names: List[str], selected_race: Race, race_name: str) -> str:
+    """
+    Render the full subrace menu (header, entries, separators) as one string
+    so the selection loop can emit it with a single write.
+    """
+    lines = ["", f"{Fore.CYAN}=== Select Your Subrace ==={Style.RESET_ALL}", _SEPARATOR]
+
+    # Render each subrace choice with a one-line description and modifiers summary.
+    for i, subrace in enumerate(subrace_names, 1):
+        if subrace.startswith("Base "):
+            # Base variant: describe plainly and show no additional modifiers.
+            desc = f"Standard {race_name} with no subrace-specific traits."
+            modifiers_str = "No additional modifiers"
+        else:
+            # Pull subrace data and show a trimmed description + bonuses.
+            subrace_data: Dict = selected_race.subraces.get(subrace, {})
+            raw_desc = subrace_data.get("description", "No description available")
+            desc = (raw_desc[:100] + "...") if len(raw_desc) > 100 else raw_desc
+            modifiers: Dict[str, int] = subrace_data.get("stat_bonuses", {})
+            # Produce a clean "STR:+2, DEX:+1" style list, or a friendly fallback.
+            modifiers_str = ", ".join(f"{k}: {v:+d}" for k, v in modifiers.items()) or "No additional modifiers"
+
+        lines.append(f"{Fore.YELLOW}{i}. {subrace}{Style.RESET_ALL}")
+        lines.append(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
+        lines.append(f"     {Fore.LIGHTYELLOW_EX}Modifiers: {modifiers_str}{Style.RESET_ALL}")
+        lines.append(_SEPARATOR)
+
+    return "\n".join(lines) + "\n"
+
+
+def _build_domain_menu(domains: List[str]) -> str:
+    """Render the Cleric domain menu as one string (see _build_menu)."""
+    lines = ["", f"{Fore.CYAN}=== Select a Cleric Domain ==={Style.RESET_ALL}", _SEPARATOR]
+    for i, domain in enumerate(domains, 1):
+        desc = _DOMAIN_DESCRIPTIONS.get(domain, "No description available")
+        lines.append(f"{Fore.YELLOW}{i}. {domain}{Style.RESET_ALL}")
+        lines.append(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
+        lines.append(_SEPARATOR)
+    return "\n".join(lines) + "\n"
 
 
 def _select_subrace_for_race(selected_race: Race, race_name: str) -> Optional[str]:
@@ -59,46 +133,9 @@ def _select_subrace_for_race(selected_race: Race, race_name: str) -> Optional[st
     # Build display list -> ['High Elf', 'Wood Elf', 'Base Elf']
     subrace_names = list(selected_race.subraces.keys()) + [f"Base {race_name}"]
 
-    while True:
-        _clear_screen()
-        print(f"\n{Fore.CYAN}=== Select Your Subrace ==={Style.RESET_ALL}")
-        print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-
-        # Render each subrace choice with a one-line description and modifiers summary.
-        for i, subrace in enumerate(subrace_names, 1):
-            if subrace.startswith("Base "):
-                # Base variant: describe plainly and show no additional modifiers.
-                desc = f"Standard {race_name} with no subrace-specific traits."
-                modifiers_str = "No additional modifiers"
-            else:
-                # Pull subrace data and show a trimmed description + bonuses.
-                subrace_data: Dict = selected_race.subraces.get(subrace, {})
-                raw_desc = subrace_data.get("description", "No description available")
-                desc = (raw_desc[:100] + "...") if len(raw_desc) > 100 else raw_desc
-                modifiers: Dict[str, int] = subrace_data.get("stat_bonuses", {})
-                # Produce a clean "STR:+2, DEX:+1" style list, or a friendly fallback.
-                modifiers_str = ", ".join(f"{k}: {v:+d}" for k, v in modifiers.items()) or "No additional modifiers"
-
-            print(f"{Fore.YELLOW}{i}. {subrace}{Style.RESET_ALL}")
-            print(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
-            print(f"     {Fore.LIGHTYELLOW_EX}Modifiers: {modifiers_str}{Style.RESET_ALL}")
-            print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-
-        # Accept numeric selection or 'q' to quit back to main menu.
-        try:
-            choice = input(f"\n{Fore.CYAN}Enter number (or 'q' to quit): {Style.RESET_ALL}").strip().lower()
-            if choice == 'q':
-                logger.info("Game exited during subrace selection")
-                raise SystemExit("Subrace selection cancelled")
-            idx = int(choice) - 1
-            if 0 <= idx < len(subrace_names):
-                return subrace_names[idx]
-            else:
-                print(f"{Fore.RED}Invalid choice. Please select a number between 1 and {len(subrace_names)}.{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
-        except ValueError:
-            print(f"{Fore.RED}Invalid input. Please enter a number or 'q'.{Style.RESET_ALL}")
-            input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+    # The menu never changes while the player is choosing, so render and draw it once.
+    _show_menu(_build_menu(subrace_names, selected_race, race_name))
+    return subrace_names[_prompt_menu_choice(len(subrace_names), "subrace")]
 
 
 def _select_cleric_domain_if_needed(class_name: str) -> Optional[str]:
@@ -112,41 +149,11 @@ def _select_cleric_domain_if_needed(class_name: str) -> Optional[str]:
         return None
 
     # You can expand this list or load it from JSON if desired.
-    domains = ["Air", "Death", "Healing", "War"]
-
-    while True:
-        _clear_screen()
-        print(f"\n{Fore.CYAN}=== Select a Cleric Domain ==={Style.RESET_ALL}")
-        print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-
-        for i, domain in enumerate(domains, 1):
-            # Lightweight flavor text for clarity.
-            desc = {
-                "Air": "Masters of wind and storms, wielding tempestuous magic.",
-                "Death": "Commanders of necromantic energies and the undead.",
-                "Healing": "Restorers of life and vitality through divine power.",
-                "War": "Champions of battle, blessed with martial prowess."
-            }.get(domain, "No description available")
-            print(f"{Fore.YELLOW}{i}. {domain}{Style.RESET_ALL}")
-            print(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
-            print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-
-        try:
-            choice = input(f"\n{Fore.CYAN}Enter number (or 'q' to quit): {Style.RESET_ALL}").strip().lower()
-            if choice == 'q':
-                logger.info("Game exited during domain selection")
-                raise SystemExit("Domain selection cancelled")
-            idx = int(choice) - 1
-            if 0 <= idx < len(domains):
-                domain = domains[idx]
-                logger.debug(f"Selected domain: {domain}")
-                return domain
-            else:
-                print(f"{Fore.RED}Invalid choice. Please select a number between 1 and {len(domains)}.{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
-        except ValueError:
-            print(f"{Fore.RED}Invalid input. Please enter a number or 'q'.{Style.RESET_ALL}")
-            input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+    domains = list(_DOMAIN_DESCRIPTIONS)
+    _show_menu(_build_domain_menu(domains))
+    domain = domains[_prompt_menu_choice(len(domains), "domain")]
+    logger.debug("Selected domain: %s", domain)
+    return domain
 
 
 def create_player(name: str, game: object) -> Optional['Character']:
@@ -175,7 +182,15 @@ def create_player(name: str, game: object) -> Optional['Character']:
         print(f"{Fore.RED}Error: No races are defined. Please check your data files.{Style.RESET_ALL}")
         return None
 
-    races: List[Race] = [Race(**r) if isinstance(r, dict) else r for r in raw_races]
+    # game.races is stable for a session, so keep the converted list on the game
+    # object and only rebuild it if the underlying list object is replaced.
+    cached = getattr(game, "_races_cached", None)
+    if cached is None or cached[0] is not raw_races:
+        races = [Race(**r) if isinstance(r, dict) else r for r in raw_races]
+        cached = (raw_races, races, {r.name: r for r in races})
+        game._races_cached = cached
+    races: List[Race] = cached[1]
+    races_by_name: Dict[str, Race] = cached[2]
 
     # ---------------------------
     # 2) Read classes dictionary
@@ -202,9 +217,9 @@ def create_player(name: str, game: object) -> Optional['Character']:
         # 3) Race selection (menu)
         # ---------------------------
         selections["race"] = select_race(races)
-        selected_race: Optional[Race] = next((r for r in races if r.name == selections["race"]), None)
+        selected_race: Optional[Race] = races_by_name.get(selections["race"])
         if not selected_race:
-            logger.error(f"Selected race '{selections['race']}' not found in game.races")
+            logger.error("Selected race '%s' not found in game.races", selections['race'])
             print(f"{Fore.RED}Error: Selected race not found. Please check your data files.{Style.RESET_ALL}")
             return None
 
@@ -224,7 +239,7 @@ def create_player(name: str, game: object) -> Optional['Character']:
         # ---------------------------
         selections["class"] = select_class(classes)
         if selections["class"] not in classes:
-            logger.error(f"Selected class '{selections['class']}' not in classes dictionary.")
+            logger.error("Selected class '%s' not in classes dictionary.", selections['class'])
             print(f"{Fore.RED}Error: Selected class not found. Please check your data files.{Style.RESET_ALL}")
             return None
 
@@ -287,5 +302,5 @@ def create_player(name: str, game: object) -> Optional['Character']:
     except SystemExit as e:
         # Graceful "quit" path from within selection menus
         print(f"{Fore.YELLOW}{str(e)}{Style.RESET_ALL}")
-        logger.info(f"Character creation cancelled: {str(e)}")
+        logger.info("Character creation cancelled: %s", e)
         return None
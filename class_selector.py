@@ -1,27 +1,40 @@
-import os
+import sys
 import logging
-from typing import Dict
+from typing import Dict, List, Tuple
 from colorama import Fore, Style
 
+from dnd_adventure.console_utils import clear_screen
+
 logger = logging.getLogger(__name__)
 
+_SEPARATOR = f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}"
+
+def _render_class_menu(class_list: List[Tuple[str, Dict]]) -> str:
+    """Build the whole class menu as one string so each redraw is a single write."""
+    lines = ["", f"{Fore.CYAN}=== Select Your Class ==={Style.RESET_ALL}", _SEPARATOR]
+    for i, (class_name, class_data) in enumerate(class_list, 1):
+        desc = class_data.get("description", "No description available")
+        desc = desc[:100] + "..." if len(desc) > 100 else desc
+        lines.append(f"{Fore.YELLOW}{i}. {class_name}{Style.RESET_ALL}")
+        lines.append(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
+        lines.append(_SEPARATOR)
+    return "\n".join(lines) + "\n"
+
+def _draw(menu: str) -> None:
+    clear_screen()
+    sys.stdout.write(menu)
+    sys.stdout.flush()
+
 def select_class(classes: Dict) -> str:
     logger.debug("Starting class selection")
-    os.system('cls' if os.name == 'nt' else 'clear')
-    print(f"\n{Fore.CYAN}=== Select Your Class ==={Style.RESET_ALL}")
-    print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
     class_list = []
     for class_name, class_data in classes.items():
         # Skip subclasses with prerequisites (e.g., Assassin, Archmage)
         if 'prerequisites' in class_data and class_data['prerequisites'].get('level', 1) > 1:
             continue
         class_list.append((class_name, class_data))
-    for i, (class_name, class_data) in enumerate(class_list, 1):
-        desc = class_data.get("description", "No description available")
-        desc = desc[:100] + "..." if len(desc) > 100 else desc
-        print(f"{Fore.YELLOW}{i}. {class_name}{Style.RESET_ALL}")
-        print(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
-        print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
+    menu = _render_class_menu(class_list)
+    _draw(menu)
     while True:
         try:
             choice = input(f"\n{Fore.CYAN}Enter number (or 'q' to quit): {Style.RESET_ALL}").strip().lower()
@@ -35,24 +48,8 @@ def select_class(classes: Dict) -> str:
                 return selected_class
             print(f"{Fore.RED}Invalid choice. Please select a number between 1 and {len(class_list)}.{Style.RESET_ALL}")
             input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"\n{Fore.CYAN}=== Select Your Class ==={Style.RESET_ALL}")
-            print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-            for i, (class_name, class_data) in enumerate(class_list, 1):
-                desc = class_data.get("description", "No description available")
-                desc = desc[:100] + "..." if len(desc) > 100 else desc
-                print(f"{Fore.YELLOW}{i}. {class_name}{Style.RESET_ALL}")
-                print(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
-                print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
+            _draw(menu)
         except ValueError:
             print(f"{Fore.RED}Invalid input. Please enter a number or 'q'.{Style.RESET_ALL}")
             input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"\n{Fore.CYAN}=== Select Your Class ==={Style.RESET_ALL}")
-            print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
-            for i, (class_name, class_data) in enumerate(class_list, 1):
-                desc = class_data.get("description", "No description available")
-                desc = desc[:100] + "..." if len(desc) > 100 else desc
-                print(f"{Fore.YELLOW}{i}. {class_name}{Style.RESET_ALL}")
-                print(f"     {Fore.LIGHTYELLOW_EX}{desc}{Style.RESET_ALL}")
-                print(f"{Fore.LIGHTBLACK_EX}----------------------------------------{Style.RESET_ALL}")
\ No newline at end of file
+            _draw(menu)
\ No newline at end of file
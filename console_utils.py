@@ -1,30 +1,43 @@
 from colorama import Fore, Style
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# main() initialises colorama with autoreset=True, which appends
+# Style.RESET_ALL after every stdout write, so console_print only emits the
+# leading colour code.
+
+COLOR_MAP = {
+    "cyan": Fore.CYAN,
+    "yellow": Fore.YELLOW,
+    "red": Fore.RED,
+    "white": Fore.WHITE
+}
+
 def console_print(text, color="white", flush=False):
-    color_map = {
-        "cyan": Fore.CYAN,
-        "yellow": Fore.YELLOW,
-        "red": Fore.RED,
-        "white": Fore.WHITE
-    }
     try:
-        print(f"{color_map.get(color, Fore.WHITE)}{text}{Style.RESET_ALL}", flush=flush)
-        logger.debug(f"Console print: {text}")
+        print(f"{COLOR_MAP.get(color, Fore.WHITE)}{text}", flush=flush)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Console print: %s", text)
     except Exception as e:
         logger.error(f"Console print error: {e}")
 
 def console_input(prompt, color="white"):
-    color_map = {
-        "cyan": Fore.CYAN,
-        "yellow": Fore.YELLOW,
-        "red": Fore.RED,
-        "white": Fore.WHITE
-    }
     try:
-        return input(f"{color_map.get(color, Fore.WHITE)}{prompt}{Style.RESET_ALL}")
+        # input() on a terminal writes the prompt through readline, bypassing
+        # colorama's wrapper (and autoreset), so the prompt resets itself.
+        return input(f"{COLOR_MAP.get(color, Fore.WHITE)}{prompt}{Style.RESET_ALL}")
     except Exception as e:
         logger.error(f"Console input error: {e}")
-        return ""
\ No newline at end of file
+        return ""
+
+def clear_screen():
+    """
+    Clear the terminal with an ANSI erase + cursor-home sequence (colorama
+    translates it on Windows). Skipped when stdout is not a terminal.
+    """
+    if not sys.stdout.isatty():
+        return
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
@@ -32,7 +32,17 @@ class Game:
     def __init__(self, player_name: str, player_manager: PlayerManager, save_file: Optional[str] = None):
         logger.debug(f"Initializing Game object for player: {player_name}")
         print("DEBUG: Initializing Game...")
+        # Loop-visible state is set up front so it exists even if init bails out early.
+        self.running = True
+        self.mode = "movement"
+        self.message = ""
+        self.player_pos = None
         self.player_name = player_name
+        # Created before anything reads the save; the prefetch lets the disk read
+        # overlap with graphics/world/classes setup below.
+        self.save_manager = SaveManager()
+        if save_file:
+            self.save_manager.prefetch(save_file)
         self.graphics = load_graphics()
         self.world = World(seed=None, graphics=self.graphics)
 
@@ -72,14 +82,11 @@ class Game:
 
         themes_dir = os.path.join(os.path.dirname(__file__), 'data', 'themes')
         self.lore_manager = LoreManager(themes_dir)
-        self.save_manager = SaveManager()
         self.ui_manager = UIManager(self)
         self.ui_manager.display_lore_screen(theme)
 
         self.current_room = self._get_starting_room()
         self.player_pos = (2, 2)
-        self.running = True
-        self.mode = "movement"
         self.debug_mode = False
         self.previous_menu = None
         self.commands = [
@@ -88,7 +95,6 @@ class Game:
         ]
         self.current_map = None
         self.last_world_pos = self.player_pos
-        self.message = ""
         self.last_enter_time = 0
         self.last_key_time = 0.0
         self.show_status = False
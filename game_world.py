@@ -1,8 +1,13 @@
+import functools
+import hashlib
 import logging
 import json
 import os
+import pathlib
+import pickle
 import random
 import sys
+from collections.abc import MutableMapping
 from typing import Dict, Any, List
 
 from dnd_adventure.room import Room, RoomType
@@ -10,11 +15,91 @@ from dnd_adventure.world import World
 from dnd_adventure.npc import NPC
 from dnd_adventure.worldgen.world_state import WorldState
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 # Ensure relative imports work when launched as a module
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 logger = logging.getLogger(__name__)
 
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+_SAVES_DIR = os.path.join(_PROJECT_ROOT, "saves")
+
+# Root for per-character world folders; override with the DND_SAVES env var.
+SAVE_ROOT = pathlib.Path(os.environ.get("DND_SAVES") or os.path.join(_SAVES_DIR, "worlds"))
+
+THEMES_DIR = os.path.join(_PROJECT_ROOT, "data", "themes")
+# All WorldState categories are saved together in this file; state.meta is a
+# small JSON sidecar next to it.
+WORLD_STATE_BLOB = "state.pkl"
+WORLD_STATE_ATTRS = ("geography", "biomes", "civilizations", "events", "npcs", "dialogues", "timeline")
+
+
+def _dump_json_bytes(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _atomic_write(path: pathlib.Path, data: bytes) -> None:
+    """Write to a temp file and swap it in, so a crash never leaves a truncated file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> Any:
+    """Read and parse a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_theme_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a theme file; keyed on mtime so edits on disk are picked up."""
+    data = _read_json(path)
+    logger.debug("Loaded theme data: %s", path)
+    return data
+
+
+def _load_theme_file(theme: str) -> Dict[str, Any]:
+    """
+    Return data/themes/<theme>.json, falling back to fantasy.json, parsing each
+    file at most once per modification. The returned dict is shared between
+    GameWorld instances; treat it as read-only.
+    """
+    theme_file = os.path.join(THEMES_DIR, f"{theme}.json")
+    try:
+        return _load_theme_cached(theme_file, os.stat(theme_file).st_mtime)
+    except FileNotFoundError:
+        fallback_file = os.path.join(THEMES_DIR, "fantasy.json")
+        logger.error("Theme file not found: %s; falling back to %s", theme_file, fallback_file)
+        return _load_theme_cached(fallback_file, os.stat(fallback_file).st_mtime)
+
+
+def _build_room_specs() -> List[tuple]:
+    """Lay out the fixed 5x5 room grid as (key, id, name, description, type) tuples."""
+    specs = []
+    for i in range(5):
+        for j in range(5):
+            room_key = f"{i},{j}"
+            room_type = RoomType.PLAINS if (i + j) & 1 else RoomType.DUNGEON
+            description = f"A {'dark' if room_type.name == 'dungeon' else 'peaceful'} area at {room_key}"
+            specs.append((room_key, int(f"{i}{j}"), f"Room {room_key}", description, room_type))
+    return specs
+
+
+# The grid is identical for every game, so lay it out once at import.
+_ROOM_SPECS = _build_room_specs()
+# The grid's first room is always a dungeon by the (i + j) parity rule.
+_STARTING_ROOM_ID = "0,0"
+
 
 class GameWorld:
     def __init__(self, world: World, character_name: str, theme: str = "fantasy"):
@@ -23,145 +108,144 @@ class GameWorld:
         self.character_name = character_name
         self.theme = theme
         self.starting_room_id: str | None = None
+        # True when world_state holds changes that are not yet on disk.
+        self._world_dirty = False
 
-        self.project_root = os.path.dirname(os.path.abspath(__file__))
-        self.saves_dir = os.path.join(self.project_root, "saves")
-        self.world_dir = os.path.join(self.saves_dir, "worlds", f"{character_name}_world")
+        self.project_root = _PROJECT_ROOT
+        self.saves_dir = _SAVES_DIR
+        self.world_dir = SAVE_ROOT / f"{character_name}_world"
+        self.world_dir.mkdir(parents=True, exist_ok=True)
 
         self.theme_data = self.load_theme_data()
         self.world_state = self.load_or_generate_world()
         self.generate_rooms()
 
     def load_theme_data(self) -> Dict[str, Any]:
-        data_dir = os.path.join(self.project_root, "data", "themes")
-        theme_file = os.path.join(data_dir, f"{self.theme}.json")
-        fallback_file = os.path.join(data_dir, "fantasy.json")
-
-        try:
-            with open(theme_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            logger.debug(f"Loaded theme data: {theme_file}")
-            return data
-        except FileNotFoundError:
-            logger.error(f"Theme file not found: {theme_file}; falling back to {fallback_file}")
-            with open(fallback_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+        return _load_theme_file(self.theme)
 
     def load_or_generate_world(self) -> WorldState:
-        os.makedirs(self.world_dir, exist_ok=True)
-        state_meta = os.path.join(self.world_dir, "state.meta")
+        state_meta = self.world_dir / "state.meta"
 
-        world_name = os.path.basename(self.world_dir)
+        world_name = self.world_dir.name
         base_dir = self.project_root
 
-        if os.path.exists(state_meta):
-            logger.debug(f"Loading WorldState from {self.world_dir}")
+        if state_meta.exists():
+            logger.debug("Loading WorldState from %s", self.world_dir)
             try:
                 return self.load_world_state(self.world_dir, world_name, base_dir)
             except Exception as e:
-                logger.error(f"Failed to load WorldState from {self.world_dir}: {e}")
+                logger.error("Failed to load WorldState from %s: %s", self.world_dir, e)
 
-        logger.debug(f"Generating new WorldState for {self.character_name}")
+        logger.debug("Generating new WorldState for %s", self.character_name)
         ws = WorldState(world_name, base_dir)
         ws.generate()
+        self._world_dirty = True
         self.save_world_state(ws)
         return ws
 
     def load_world_state(self, world_dir: str, world_name: str, base_dir: str) -> WorldState:
-        logger.debug(f"Loading WorldState from {world_dir}")
+        logger.debug("Loading WorldState from %s", world_dir)
         ws = WorldState(world_name, base_dir)
 
-        def _load_json_if_exists(path: str, default):
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            return default
-
-        ws.data = {
-            "geography": _load_json_if_exists(os.path.join(world_dir, "geography.json"), {}),
-            "biomes": _load_json_if_exists(os.path.join(world_dir, "biomes.json"), {}),
-            "civilizations": _load_json_if_exists(os.path.join(world_dir, "civilizations.json"), []),
-            "events": _load_json_if_exists(os.path.join(world_dir, "events.json"), []),
-            "npcs": _load_json_if_exists(os.path.join(world_dir, "npcs.json"), []),
-            "dialogues": _load_json_if_exists(os.path.join(world_dir, "dialogues.json"), []),
-            "timeline": _load_json_if_exists(os.path.join(world_dir, "timeline.json"), []),
+        defaults = {
+            "geography": {},
+            "biomes": {},
+            "civilizations": [],
+            "events": [],
+            "npcs": [],
+            "dialogues": [],
+            "timeline": [],
         }
-
-        meta_path = os.path.join(world_dir, "state.meta")
-        if os.path.exists(meta_path):
-            with open(meta_path, "r", encoding="utf-8") as f:
-                try:
-                    meta = json.load(f)
-                except Exception:
-                    meta = {}
+        # One directory listing tells us which files exist, instead of an
+        # exists() check per category.
+        with os.scandir(world_dir) as it:
+            entries = {entry.name: entry.path for entry in it if entry.is_file()}
+
+        # Everything is decoded here, so a corrupt save raises inside
+        # load_or_generate_world's try and the world is regenerated.
+        blob_path = entries.get(WORLD_STATE_BLOB)
+        if blob_path:
+            with open(blob_path, "rb") as f:
+                saved = pickle.load(f)
+            if not isinstance(saved, dict):
+                raise ValueError(f"{blob_path} does not hold a category mapping")
+            ws.data = {key: saved.get(key, default) for key, default in defaults.items()}
         else:
-            meta = {}
+            # Older saves keep one JSON file per category.
+            ws.data = {
+                key: _read_json(entries[f"{key}.json"]) if f"{key}.json" in entries else default
+                for key, default in defaults.items()
+            }
+
+        meta = {}
+        meta_path = entries.get("state.meta")
+        if meta_path:
+            try:
+                meta = _read_json(meta_path)
+            except Exception:
+                meta = {}
 
         if "timeline" in meta and not ws.data.get("timeline"):
             ws.data["timeline"] = meta.get("timeline", [])
         if "dialogue" in meta and not ws.data.get("dialogues"):
             ws.data["dialogues"] = meta.get("dialogue", [])
 
-        logger.info(f"Loaded WorldState for {world_name}")
+        logger.info("Loaded WorldState for %s", world_name)
         return ws
 
     def save_world_state(self, world_state: WorldState):
-        logger.debug(f"Saving WorldState to {self.world_dir}")
-        os.makedirs(self.world_dir, exist_ok=True)
-
-        if hasattr(world_state, "data") and isinstance(world_state.data, dict):
-            for key, value in world_state.data.items():
-                path = os.path.join(self.world_dir, f"{key}.json")
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(value, f, indent=2)
+        if not self._world_dirty:
+            logger.debug("WorldState unchanged; skipping save to %s", self.world_dir)
+            return
+
+        logger.debug("Saving WorldState to %s", self.world_dir)
+
+        if hasattr(world_state, "data") and isinstance(world_state.data, MutableMapping):
+            data = dict(world_state.data)
         else:
-            attrs = ["geography", "biomes", "civilizations", "events", "npcs", "dialogues", "timeline"]
-            for attr in attrs:
-                if hasattr(world_state, attr):
-                    path = os.path.join(self.world_dir, f"{attr}.json")
-                    with open(path, "w", encoding="utf-8") as f:
-                        json.dump(getattr(world_state, attr), f, indent=2)
+            data = {attr: getattr(world_state, attr)
+                    for attr in WORLD_STATE_ATTRS if hasattr(world_state, attr)}
 
         meta = {
-            "world_name": getattr(world_state, "world_name", os.path.basename(self.world_dir)),
+            "world_name": getattr(world_state, "world_name", self.world_dir.name),
             "dialogue_count": len(world_state.data.get("dialogues", [])) if hasattr(world_state, "data") else 0,
             "event_count": len(world_state.data.get("events", [])) if hasattr(world_state, "data") else 0,
         }
-        with open(os.path.join(self.world_dir, "state.meta"), "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2)
 
-        logger.info(f"Saved WorldState to {self.world_dir}")
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        meta["blob_hash"] = hashlib.blake2b(blob, digest_size=16).hexdigest()
 
-    def generate_rooms(self) -> None:
-        self.rooms = {}
-
-        for i in range(5):
-            for j in range(5):
-                room_key = f"{i},{j}"
-                room_type = RoomType("dungeon") if (i + j) % 2 == 0 else RoomType("plains")
-                room_id = int(f"{i}{j}")
-                name = f"Room {room_key}"
-                description = f"A {'dark' if room_type.name == 'dungeon' else 'peaceful'} area at {room_key}"
-                exits = {}
-
-                room = Room(
-                    room_id=room_id,
-                    name=name,
-                    description=description,
-                    room_type=room_type,
-                    exits=exits
-                )
-                self.rooms[room_key] = room
+        # The previous save's hash lives in state.meta; skip rewriting an identical blob.
+        blob_path = self.world_dir / WORLD_STATE_BLOB
+        meta_path = self.world_dir / "state.meta"
+        try:
+            previous_hash = _read_json(meta_path).get("blob_hash") if blob_path.exists() else None
+        except Exception:
+            previous_hash = None
+        if previous_hash != meta["blob_hash"]:
+            _atomic_write(blob_path, blob)
+        else:
+            logger.debug("WorldState blob unchanged; not rewriting %s", blob_path)
 
-        preferred_start = next((rid for rid, r in self.rooms.items()
-                                if r.room_type.name == "dungeon"), None)
-        fallback = next(iter(self.rooms.keys()), None)
-        self.starting_room_id = preferred_start or fallback
+        _atomic_write(meta_path, _dump_json_bytes(meta))
 
-        if self.starting_room_id:
-            logger.info(f"Starting room set to: {self.starting_room_id}")
-        else:
-            logger.error("No rooms generated — cannot set starting room.")
+        self._world_dirty = False
+        logger.info("Saved WorldState to %s", self.world_dir)
+
+    def generate_rooms(self) -> None:
+        # Rooms are mutable per game, so build fresh ones from the shared specs.
+        self.rooms = {
+            room_key: Room(
+                room_id=room_id,
+                name=name,
+                description=description,
+                room_type=room_type,
+                exits={}
+            )
+            for room_key, room_id, name, description, room_type in _ROOM_SPECS
+        }
+        self.starting_room_id = _STARTING_ROOM_ID
+        logger.info("Starting room set to: %s", self.starting_room_id)
 
     def _create_templated_npcs(self, npc_templates: List[Dict[str, Any]], civ: Dict[str, Any] | None) -> List[NPC]:
         npcs: List[NPC] = []
@@ -185,10 +269,5 @@ class GameWorld:
             )
         return npcs
 
-    def _ws_set(self, key: str, value: Any):
-        if not hasattr(self.world_state, "data") or not isinstance(self.world_state.data, dict):
-            self.world_state.data = {}
-        self.world_state.data[key] = value
-
     def get_room(self, room_id: str) -> Room:
         return self.rooms.get(room_id)
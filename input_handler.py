@@ -8,42 +8,35 @@ Returns:
   - any typed command line (when in command mode, handled by main loop)
 """
 
-from .msvcrt_compat import kbhit, getch
+from .msvcrt_compat import kbhit, getch, wait_key
 
-# You can customize these mappings if desired.
-MOVE_KEYS = {
-    "w": "w",
-    "a": "a",
-    "s": "s",
-    "d": "d",
-    "W": "w",
-    "A": "a",
-    "S": "s",
-    "D": "d",
-}
+# You can customize these keys if desired (matched case-insensitively).
+MOVE_KEYS = {"w", "a", "s", "d"}
 
-def handle_input(game) -> str:
+def handle_input(game, timeout: float = 0.0) -> str:
     """
-    Non-blocking input for movement mode.
-    When Enter is pressed, return "enter".
-    Otherwise, return one of the expected commands or "" if no input.
+    Input for movement mode. Waits up to `timeout` seconds for a key (0 means
+    don't wait), waking as soon as one arrives.
+    Drains every key pressed since the last tick so bursts don't lag behind
+    the screen. Enter (or a help/debug key) wins immediately; otherwise the
+    last movement key pressed is returned, or "" if there was none.
     """
     try:
-        # Prefer non-blocking single-key reads
-        if kbhit():
-            ch = getch()
+        if timeout > 0 and not wait_key(timeout):
+            return ""
+        last = ""
+        while kbhit():
+            ch = getch().lower()
             if ch in ("\r", "\n"):
                 return "enter"
             if ch in MOVE_KEYS:
-                return MOVE_KEYS[ch]
+                last = ch
             # Optional helpers
-            if ch in ("h", "H", "?"):
+            elif ch in ("h", "?"):
                 return "help"
-            if ch in ("g", "G"):
+            elif ch == "g":
                 return "debug"
-            return ""
-        # No key ready
-        return ""
+        return last
     except Exception:
         # Fallback: environments where raw mode isn't available (e.g., some IDE consoles)
         # In that case, just prompt (blocking). You can tailor this to your game's mode.
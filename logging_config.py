@@ -1,20 +1,23 @@
 # dnd_adventure/logging_config.py
 import logging
 import os
+import sys
 import tempfile
-from logging import StreamHandler, FileHandler
-from typing import Tuple
+from logging import StreamHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import Optional, Tuple
+
+# (logs_dir, log_file) once resolved; the location can't change within a process.
+_LOGS_LOCATION: Optional[Tuple[str, str]] = None
 
 def _ensure_dir(path: str) -> bool:
     """Ensure a directory exists; return True if ready."""
     try:
         os.makedirs(path, exist_ok=True)
-        # Check writability by attempting to create a tiny temp file
-        test_path = os.path.join(path, ".writetest")
-        with open(test_path, "w", encoding="utf-8") as f:
-            f.write("ok")
-        os.remove(test_path)
-        return True
+        # Check writability without creating and deleting a probe file.
+        # os.access ignores Windows ACLs, so setup_logging also opens the
+        # file handler eagerly to surface a false positive at startup.
+        return os.access(path, os.W_OK)
     except Exception:
         return False
 
@@ -26,6 +29,10 @@ def _pick_logs_location() -> Tuple[str, str]:
       3) <temp>/dnd_adventure_logs/
     Returns: (logs_dir, log_file)
     """
+    global _LOGS_LOCATION
+    if _LOGS_LOCATION is not None:
+        return _LOGS_LOCATION
+
     # project_root: parent of the dnd_adventure/ package
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     candidates = [
@@ -36,18 +43,20 @@ def _pick_logs_location() -> Tuple[str, str]:
 
     for logs_dir in candidates:
         if _ensure_dir(logs_dir):
-            return logs_dir, os.path.join(logs_dir, "dnd_adventure.log")
+            _LOGS_LOCATION = (logs_dir, os.path.join(logs_dir, "dnd_adventure.log"))
+            return _LOGS_LOCATION
 
     # Last resort: current directory (should nearly always work)
     fallback_dir = os.getcwd()
     _ensure_dir(fallback_dir)
-    return fallback_dir, os.path.join(fallback_dir, "dnd_adventure.log")
+    _LOGS_LOCATION = (fallback_dir, os.path.join(fallback_dir, "dnd_adventure.log"))
+    return _LOGS_LOCATION
 
 def setup_logging(level: int = logging.INFO) -> None:
     """
     Cross-platform logging setup (macOS/Windows/Linux).
     - Ensures a writable logs directory and file exist (with fallbacks).
-    - Writes to file + console.
+    - Writes to a rotating, buffered log file + console.
     - Safe to call multiple times (no duplicate handlers).
     """
     logger = logging.getLogger()
@@ -77,10 +86,19 @@ def setup_logging(level: int = logging.INFO) -> None:
     # File handler (if available)
     if log_file:
         try:
-            file_handler = FileHandler(log_file, encoding="utf-8")
+            # Opened eagerly (no delay=True): behind the MemoryHandler a lazy
+            # open would only fail at the first flush, after startup.
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=5_000_000, backupCount=3, encoding="utf-8"
+            )
             file_handler.setFormatter(formatter)
             file_handler.setLevel(level)
-            logger.addHandler(file_handler)
+            # Batch records in memory; anything WARNING or above flushes immediately.
+            # Kept small so a hard kill loses at most a few dozen records; a
+            # normal exit flushes through logging's own atexit shutdown().
+            buffered = MemoryHandler(64, flushLevel=logging.WARNING, target=file_handler)
+            buffered.setLevel(level)
+            logger.addHandler(buffered)
         except Exception as e:
             print(f"[Logger] Warning: failed to attach file handler: {e}")
 
@@ -93,6 +111,20 @@ def setup_logging(level: int = logging.INFO) -> None:
     # Mark as configured to prevent duplicates
     logger._dnd_handlers_installed = True  # type: ignore[attr-defined]
 
+    # Log uncaught exceptions at CRITICAL: that flushes the buffered records
+    # leading up to the crash to the file, along with the traceback itself.
+    previous_hook = sys.excepthook
+
+    def _log_uncaught(exc_type, exc, tb):
+        if issubclass(exc_type, KeyboardInterrupt):
+            previous_hook(exc_type, exc, tb)
+            return
+        # The console handler prints the traceback too, so the default hook
+        # is not called again.
+        logger.critical("Uncaught exception", exc_info=(exc_type, exc, tb))
+
+    sys.excepthook = _log_uncaught
+
     # A couple of helpful startup lines
     logger.info("Logging initialized.")
     logger.info(f"Logs directory: {logs_dir}")
@@ -9,33 +9,56 @@ from colorama import init, Fore, Style
 from .msvcrt_compat import kbhit, getch
 
 # ✅ Relative imports (because main.py is inside the dnd_adventure package)
-from .game import Game
+# Game and PlayerManager pull in the whole engine, so they're imported in main().
 from .input_handler import handle_input
-from .ui import UIManager
+from .console_utils import clear_screen
 from .logging_config import setup_logging
 
-# PlayerManager is in an external package folder per your project layout
-from .player_manager.player_manager import PlayerManager
-
-setup_logging()
 logger = logging.getLogger(__name__)
 
+# Start menu text never changes, so render it once.
+_START_MENU = "\n".join(
+    f"{Fore.CYAN}{line}{Style.RESET_ALL}"
+    for line in (
+        "=== D&D Adventure ===",
+        "1. New Game",
+        "2. Continue Game",
+        "3. Select Character",
+        "4. Delete Character",
+        "5. Exit",
+    )
+)
+_START_PROMPT = f"{Fore.YELLOW}Select an option (1-5): {Style.RESET_ALL}"
+_INVALID_OPTION = f"{Fore.RED}Invalid option! Please select 1-5.{Style.RESET_ALL}"
+
 def display_start_menu():
-    print(f"{Fore.CYAN}=== D&D Adventure ==={Style.RESET_ALL}")
-    print(f"{Fore.CYAN}1. New Game{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}2. Continue Game{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}3. Select Character{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}4. Delete Character{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}5. Exit{Style.RESET_ALL}")
-    choice = input(f"{Fore.YELLOW}Select an option (1-5): {Style.RESET_ALL}").strip()
+    print(_START_MENU)
+    choice = input(_START_PROMPT).strip()
     return choice
 
 def main():
+    setup_logging()
     try:
-        init()  # colorama init
+        from .game import Game
+        # PlayerManager is in an external package folder per your project layout
+        from .player_manager.player_manager import PlayerManager
+
+        init(autoreset=True)  # the only colorama init; console_utils relies on autoreset
         logger.info("Starting D&D Adventure")
 
         player_manager = PlayerManager()
+        # Warm the race/spell data while the player is still in the menu.
+        player_manager.prefetch_data()
+
+        # Save listing, cached across menu choices until a delete changes it.
+        # An ordered dict gives O(1) membership tests and a stable display order.
+        save_files_cache = None
+
+        def saves():
+            nonlocal save_files_cache
+            if save_files_cache is None:
+                save_files_cache = dict.fromkeys(Game.list_save_files())
+            return save_files_cache
 
         # Start menu loop
         while True:
@@ -47,13 +70,13 @@ def main():
                     print(f"{Fore.RED}Name cannot be empty!{Style.RESET_ALL}")
                     continue
                 game = Game(player_name, player_manager, None)
-                if not getattr(game, "running", True):
+                if not game.running:
                     print(f"{Fore.RED}Failed to start new game!{Style.RESET_ALL}")
                     continue
                 break
 
             elif choice == "2":  # Continue Game
-                save_files = Game.list_save_files()
+                save_files = saves()
                 if not save_files:
                     print(f"{Fore.RED}No save files found!{Style.RESET_ALL}")
                     continue
@@ -63,13 +86,13 @@ def main():
                     print(f"{Fore.RED}Save file not found!{Style.RESET_ALL}")
                     continue
                 game = Game(None, player_manager, save_file)
-                if not getattr(game, "running", True):
+                if not game.running:
                     print(f"{Fore.RED}Failed to load game!{Style.RESET_ALL}")
                     continue
                 break
 
             elif choice == "3":  # Select Character
-                save_files = Game.list_save_files()
+                save_files = saves()
                 if not save_files:
                     print(f"{Fore.RED}No characters found!{Style.RESET_ALL}")
                     continue
@@ -79,13 +102,13 @@ def main():
                     print(f"{Fore.RED}Character not found!{Style.RESET_ALL}")
                     continue
                 game = Game(None, player_manager, save_file)
-                if not getattr(game, "running", True):
+                if not game.running:
                     print(f"{Fore.RED}Failed to load character!{Style.RESET_ALL}")
                     continue
                 break
 
             elif choice == "4":  # Delete Character
-                save_files = Game.list_save_files()
+                save_files = saves()
                 if not save_files:
                     print(f"{Fore.RED}No characters to delete!{Style.RESET_ALL}")
                     continue
@@ -96,18 +119,19 @@ def main():
                     continue
                 try:
                     os.remove(os.path.join("dnd_adventure", "data", "saves", save_file))
+                    save_files_cache = None
                     print(f"{Fore.CYAN}Character deleted successfully!{Style.RESET_ALL}")
-                    logger.info(f"Deleted save file: {save_file}")
+                    logger.info("Deleted save file: %s", save_file)
                 except Exception as e:
                     print(f"{Fore.RED}Failed to delete character: {e}{Style.RESET_ALL}")
-                    logger.error(f"Failed to delete save file {save_file}: {e}")
+                    logger.error("Failed to delete save file %s: %s", save_file, e)
 
             elif choice == "5":  # Exit
                 print(f"{Fore.CYAN}Exiting D&D Adventure. Goodbye!{Style.RESET_ALL}")
                 return
 
             else:
-                print(f"{Fore.RED}Invalid option! Please select 1-5.{Style.RESET_ALL}")
+                print(_INVALID_OPTION)
 
         # --- Main game loop ---
         last_enter_time = 0.0
@@ -115,27 +139,27 @@ def main():
         DOUBLE_PRESS_TIMEOUT = 0.5  # seconds
         last_displayed = None  # Track last displayed state
 
-        while getattr(game, "running", True):
-            logger.debug(f"Game mode: {getattr(game, 'mode', 'movement')}")
-            current_state = (getattr(game, "player_pos", None),
-                             getattr(game, "mode", None),
-                             getattr(game, "message", None))
+        while game.running:
+            # Read the loop state once per tick.
+            mode = game.mode
+            message = game.message
+            logger.debug("Game mode: %s", mode)
+            current_state = (game.player_pos, mode, message)
 
             # Redraw only if state changed
             if current_state != last_displayed:
-                if getattr(game, "mode", "movement") == "movement" or (
-                    getattr(game, "mode", "movement") == "command" and not getattr(game, "message", "")
-                ):
-                    os.system('cls' if os.name == 'nt' else 'clear')
+                if mode == "movement" or (mode == "command" and not message):
+                    clear_screen()
                     # UI manager should know how to draw current map
                     game.ui_manager.display_current_map()
-                if getattr(game, "message", ""):
-                    print(game.message, flush=True)
+                if message:
+                    print(message, flush=True)
                 last_displayed = current_state
 
-            if getattr(game, "mode", "movement") == "movement":
-                command = handle_input(game)
-                logger.debug(f"Received command: {command}")
+            if mode == "movement":
+                # Blocks until a key arrives or the tick ends; this also paces the loop.
+                command = handle_input(game, timeout=0.05)
+                logger.debug("Received command: %s", command)
                 if command == "enter":
                     now = time.time()
                     if now - last_enter_time < DOUBLE_PRESS_TIMEOUT:
@@ -149,13 +173,13 @@ def main():
                 elif command in ["w", "s", "a", "d", "help", "debug"]:
                     game.handle_command(command)
 
-            elif getattr(game, "mode", "movement") == "command":
+            elif mode == "command":
                 cmd = input().strip()
-                logger.debug(f"Command mode input: {cmd}")
+                logger.debug("Command mode input: %s", cmd)
                 if cmd:
                     game.handle_command(cmd)
                     enter_press_count = 0
-                    if getattr(game, "message", ""):
+                    if game.message:
                         input(f"{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
                 else:
                     now = time.time()
@@ -171,10 +195,8 @@ def main():
                         last_enter_time = now
                         print(f"{Fore.YELLOW}Enter command: {Style.RESET_ALL}", end="", flush=True)
 
-            time.sleep(0.05)  # Ease CPU
-
     except Exception as e:
-        logger.error(f"Game crashed: {e}", exc_info=True)
+        logger.error("Game crashed: %s", e, exc_info=True)
         print(f"{Fore.RED}Error: Game crashed - {e}. Check dnd_adventure.log for details.{Style.RESET_ALL}")
         try:
             input(f"{Fore.YELLOW}Press Enter to exit...{Style.RESET_ALL}")
@@ -99,6 +99,20 @@ def generate_map() -> Dict[str, Any]:
     return _worldgen_generate_map()
 
 
+_NAME_PREFIXES = (
+    "Elder", "Shadow", "Mythic", "Iron", "Crystal",
+    "Dawn", "Obsidian", "Silver", "Ember", "Storm",
+)
+_NAME_MIDDLES = (
+    "fall", "wind", "vale", "crest", "reach",
+    "moor", "deep", "light", "guard", "spire",
+)
+_NAME_SUFFIXES = (
+    "", "", "",           # weight toward two-part names
+    " Realms", " Isles", " Lands", " Expanse", " Frontier",
+)
+
+
 def generate_name(seed: int | None = None) -> str:
     """
     Lightweight deterministic-ish world name generator.
@@ -112,22 +126,8 @@ def generate_name(seed: int | None = None) -> str:
     """
     rng = random.Random(seed) if seed is not None else random
 
-    prefixes = [
-        "Elder", "Shadow", "Mythic", "Iron", "Crystal",
-        "Dawn", "Obsidian", "Silver", "Ember", "Storm",
-    ]
-    middles = [
-        "fall", "wind", "vale", "crest", "reach",
-        "moor", "deep", "light", "guard", "spire",
-    ]
-    suffixes = [
-        "", "", "",           # weight toward two-part names
-        " Realms", " Isles", " Lands", " Expanse", " Frontier",
-    ]
-
-    name = rng.choice(prefixes) + rng.choice(middles) + rng.choice(suffixes)
-    # Clean up any accidental double spaces
-    return " ".join(name.split())
+    # The parts never contain stray whitespace, so no cleanup pass is needed.
+    return rng.choice(_NAME_PREFIXES) + rng.choice(_NAME_MIDDLES) + rng.choice(_NAME_SUFFIXES)
 
 
 # -----------------------------------------------------------------------------
@@ -1,16 +1,26 @@
 # dnd_adventure/msvcrt_compat.py
-# Cross-platform replacements for a couple of msvcrt functions.
+# Cross-platform replacements for a couple of msvcrt functions, plus wait_key().
 
 import sys
 
 if sys.platform == "win32":
     import msvcrt as _msvcrt
+    import time as _time
 
     msvcrt = _msvcrt
 
     def kbhit() -> bool:
         return _msvcrt.kbhit()
 
+    def wait_key(timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a key; True as soon as one is pending."""
+        deadline = _time.monotonic() + timeout
+        while not _msvcrt.kbhit():
+            if _time.monotonic() >= deadline:
+                return False
+            _time.sleep(0.005)
+        return True
+
     def getch() -> str:
         ch = _msvcrt.getch()
         try:
@@ -19,6 +29,7 @@ if sys.platform == "win32":
             return str(ch)
 else:
     # Unix-like: emulate kbhit/getch using termios/tty/select
+    import os as _os
     import sys as _sys
     import termios as _termios
     import tty as _tty
@@ -26,16 +37,48 @@ else:
 
     msvcrt = None  # sentinel (not required)
 
+    _STDIN = [_sys.stdin]
+    # (fd, cooked attrs, raw attrs), captured on the first getch().
+    _modes = None
+
     def kbhit() -> bool:
-        r, _, _ = _select.select([_sys.stdin], [], [], 0)
+        r, _, _ = _select.select(_STDIN, [], [], 0)
         return bool(r)
 
+    def wait_key(timeout: float) -> bool:
+        """Block up to `timeout` seconds for stdin to become readable."""
+        r, _, _ = _select.select(_STDIN, [], [], timeout)
+        return bool(r)
+
+    def _terminal_modes():
+        global _modes
+        if _modes is None:
+            fd = _sys.stdin.fileno()
+            cooked = _termios.tcgetattr(fd)
+            # Same flags as tty.setraw(), but built here so they can be applied
+            # with TCSANOW: setraw() uses TCSAFLUSH, which discards keys that are
+            # already queued when getch() is called.
+            raw = list(cooked)
+            raw[_tty.IFLAG] &= ~(_termios.BRKINT | _termios.ICRNL | _termios.INPCK
+                                 | _termios.ISTRIP | _termios.IXON)
+            raw[_tty.OFLAG] &= ~_termios.OPOST
+            raw[_tty.CFLAG] = (raw[_tty.CFLAG] & ~(_termios.CSIZE | _termios.PARENB)) | _termios.CS8
+            raw[_tty.LFLAG] &= ~(_termios.ECHO | _termios.ICANON | _termios.IEXTEN | _termios.ISIG)
+            raw[_tty.CC] = list(cooked[_tty.CC])
+            raw[_tty.CC][_termios.VMIN] = 1
+            raw[_tty.CC][_termios.VTIME] = 0
+            _modes = (fd, cooked, raw)
+        return _modes
+
     def getch() -> str:
-        fd = _sys.stdin.fileno()
-        old = _termios.tcgetattr(fd)
+        # The terminal goes back to cooked mode after each key because the rest
+        # of the game reads lines with input(); only the attribute lookup is cached.
+        fd, cooked, raw = _terminal_modes()
+        _termios.tcsetattr(fd, _termios.TCSANOW, raw)
         try:
-            _tty.setraw(fd)
-            ch = _sys.stdin.read(1)
+            # os.read bypasses sys.stdin's buffer, which would otherwise swallow
+            # queued keys that kbhit()'s select() can no longer see.
+            ch = _os.read(fd, 1)
         finally:
-            _termios.tcsetattr(fd, _termios.TCSADRAIN, old)
-        return ch
+            _termios.tcsetattr(fd, _termios.TCSADRAIN, cooked)
+        return ch.decode("utf-8", errors="ignore")
@@ -1,17 +1,22 @@
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 class NPC:
+    __slots__ = ("name", "race", "profession", "traits", "dialogue")
+
     def __init__(self, name: str, race: str, profession: str, traits: list, dialogue: str = "Greetings, traveler!"):
         self.name = name
-        self.race = race
-        self.profession = profession
+        # Races and professions come from a small vocabulary shared by many NPCs.
+        self.race = sys.intern(race) if isinstance(race, str) else race
+        self.profession = sys.intern(profession) if isinstance(profession, str) else profession
         self.traits = traits
         self.dialogue = dialogue
-        logger.debug(f"NPC initialized: {name} ({race}, {profession})")
+        logger.debug("NPC initialized: %s (%s, %s)", name, race, profession)
 
     def talk(self):
         """Return dialogue for the NPC."""
-        logger.debug(f"NPC {self.name} speaking: {self.dialogue}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("NPC %s speaking: %s", self.name, self.dialogue)
         return f"{self.name} the {self.race} {self.profession} says: {self.dialogue}"
\ No newline at end of file
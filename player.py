@@ -1,11 +1,31 @@
 # dnd_adventure/player.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List, Optional, Any
 
+# Save keys that map 1:1 onto Player fields with defaults.
+_OPTIONAL_SAVE_KEYS = (
+    "spells", "level", "features", "subclass", "hit_points",
+    "max_hit_points", "mp", "max_mp", "xp", "meta",
+)
 
-@dataclass
+# Save-file key order and the Player attributes that feed them ("class" is
+# stored from character_class).
+_SAVE_KEYS = ("name", "race", "subrace", "class", "stats") + _OPTIONAL_SAVE_KEYS
+_SAVE_ATTRS = attrgetter("name", "race", "subrace", "character_class", "stats", *_OPTIONAL_SAVE_KEYS)
+
+# Ability order used by legacy saves that stored stats as a plain list.
+_STAT_NAMES = ("Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma")
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class Player:
     name: str
     race: str
@@ -34,23 +54,7 @@ class Player:
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the player for saving."""
-        return {
-            "name": self.name,
-            "race": self.race,
-            "subrace": self.subrace,
-            "class": self.character_class,
-            "stats": self.stats,
-            "spells": self.spells,
-            "level": self.level,
-            "features": self.features,
-            "subclass": self.subclass,
-            "hit_points": self.hit_points,
-            "max_hit_points": self.max_hit_points,
-            "mp": self.mp,
-            "max_mp": self.max_mp,
-            "xp": self.xp,
-            "meta": self.meta,
-        }
+        return dict(zip(_SAVE_KEYS, _SAVE_ATTRS(self)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Player":
@@ -58,25 +62,22 @@ class Player:
         # Some old saves might store stats as a list; normalize to dict if needed.
         stats = data.get("stats", {})
         if isinstance(stats, list):
-            names = ["Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma"]
-            stats = dict(zip(names, stats))
+            stats = dict(zip(_STAT_NAMES, stats))
+        else:
+            stats = {_intern(k): v for k, v in stats.items()}
 
+        # Only pass what the save actually has; the field defaults cover the
+        # rest, so no throwaway default dicts/lists are built per load.
+        optional = {key: data[key] for key in _OPTIONAL_SAVE_KEYS if key in data}
+        if "subclass" in optional:
+            optional["subclass"] = _intern(optional["subclass"])
         return cls(
             name=data["name"],
-            race=data["race"],
-            subrace=data.get("subrace"),
-            character_class=data["class"],
+            race=_intern(data["race"]),
+            subrace=_intern(data.get("subrace")),
+            character_class=_intern(data["class"]),
             stats=stats,
-            spells=data.get("spells", {0: [], 1: []}),
-            level=data.get("level", 1),
-            features=data.get("features", []),
-            subclass=data.get("subclass"),
-            hit_points=data.get("hit_points", 1),
-            max_hit_points=data.get("max_hit_points", 1),
-            mp=data.get("mp", 0),
-            max_mp=data.get("max_mp", 0),
-            xp=data.get("xp", 0),
-            meta=data.get("meta", {}),
+            **optional,
         )
 
     # Convenience helpers
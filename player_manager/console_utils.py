@@ -1,36 +1,87 @@
+import atexit
 import logging
+import os
+import sys
+from typing import List
 from colorama import Fore, Style
 
+try:
+    # Importing readline gives input() line editing and history on POSIX.
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
 logger = logging.getLogger(__name__)
 
-def console_print(message: str, color: str = "white"):
+# colorama's codes are plain ANSI strings; resolve them once here.
+COLOR_MAP = {
+    "red": Fore.RED,
+    "yellow": Fore.YELLOW,
+    "cyan": Fore.CYAN,
+    "white": Fore.WHITE,
+    "green": Fore.GREEN,
+    "blue": Fore.BLUE
+}
+_RESET = Style.RESET_ALL
+
+# Redirected or dumb-terminal output gets plain text; decided once at import.
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("TERM") != "dumb"
+
+# With readline active, escape codes in a prompt must sit between \001 and
+# \002 (RL_PROMPT_START/END_IGNORE) or readline counts them as visible
+# columns and redraws edited, recalled or wrapped lines in the wrong place.
+# input() only goes through readline when stdin and stdout are terminals.
+_RL_PROMPT = _USE_COLOR and readline is not None and sys.stdin is not None and sys.stdin.isatty()
+_PROMPT_RESET = f"\001{_RESET}\002" if _RL_PROMPT else _RESET
+
+def _color_code(color: str) -> str:
+    # Callers almost always pass lowercase names; only lowercase on a miss.
+    code = COLOR_MAP.get(color)
+    return code if code is not None else COLOR_MAP.get(color.lower(), Fore.WHITE)
+
+# Pending console_print lines. Menus print many lines back to back, so they
+# are written out together when a prompt needs them or the buffer fills up.
+_out_buf: List[str] = []
+_OUT_BUF_LIMIT = 64
+
+def console_flush():
+    """Write any buffered console_print output to stdout."""
+    if _out_buf:
+        sys.stdout.write("".join(_out_buf))
+        _out_buf.clear()
+    sys.stdout.flush()
+
+atexit.register(console_flush)
+
+def _print_color(message: str, color: str = "white"):
     """Print a message to the console with the specified color."""
-    color_map = {
-        "red": Fore.RED,
-        "yellow": Fore.YELLOW,
-        "cyan": Fore.CYAN,
-        "white": Fore.WHITE,
-        "green": Fore.GREEN,
-        "blue": Fore.BLUE
-    }
-    color_code = color_map.get(color.lower(), Fore.WHITE)
-    print(f"{color_code}{message}{Style.RESET_ALL}")
-    logger.debug(f"Console print: {message}")
+    _out_buf.append(f"{_color_code(color)}{message}{_RESET}\n")
+    if len(_out_buf) >= _OUT_BUF_LIMIT:
+        console_flush()
+    logger.debug("Console print: %s", message)
+
+def _print_plain(message: str, color: str = "white"):
+    """Print a message to the console without color codes."""
+    _out_buf.append(f"{message}\n")
+    if len(_out_buf) >= _OUT_BUF_LIMIT:
+        console_flush()
+    logger.debug("Console print: %s", message)
+
+console_print = _print_color if _USE_COLOR else _print_plain
 
 def console_input(prompt: str, color: str = "white") -> str:
     """Prompt the user for input with the specified color."""
-    color_map = {
-        "red": Fore.RED,
-        "yellow": Fore.YELLOW,
-        "cyan": Fore.CYAN,
-        "white": Fore.WHITE,
-        "green": Fore.GREEN,
-        "blue": Fore.BLUE
-    }
-    color_code = color_map.get(color.lower(), Fore.WHITE)
+    # Anything printed before the prompt has to be visible first.
+    console_flush()
     try:
-        user_input = input(f"{color_code}{prompt}{Style.RESET_ALL}")
-        logger.debug(f"Console input prompt: {prompt}, received: {user_input}")
+        if not _USE_COLOR:
+            text = prompt
+        elif _RL_PROMPT:
+            text = f"\001{_color_code(color)}\002{prompt}{_PROMPT_RESET}"
+        else:
+            text = f"{_color_code(color)}{prompt}{_RESET}"
+        user_input = input(text)
+        logger.debug("Console input prompt: %s, received: %s", prompt, user_input)
         return user_input
     except KeyboardInterrupt:
         logger.warning("KeyboardInterrupt during console input")
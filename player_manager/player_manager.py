@@ -27,22 +27,147 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
 import json
 import logging
 import os
+import pickle
 import random
-from typing import Optional, Tuple, Any, Dict, List
+import sys
+import threading
+from types import MappingProxyType
+from typing import Optional, Tuple, Any, Dict, List, Mapping
 
 from colorama import Fore, Style
 
 from dnd_adventure.player import Player  # <-- no theme/graphics imports here
 
+try:
+    import orjson  # optional fast parser; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# -----------------------------------------------------------------------------
+# Console colors (resolved once; blank when stdout is not a terminal)
+# -----------------------------------------------------------------------------
+def _probe_color() -> bool:
+    """True if stdout is a terminal that accepts writes (checked once at import)."""
+    try:
+        sys.stdout.write("")
+        return sys.stdout.isatty()
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+_USE_COLOR = _probe_color()
+_CYAN = Fore.CYAN if _USE_COLOR else ""
+_YELLOW = Fore.YELLOW if _USE_COLOR else ""
+_RED = Fore.RED if _USE_COLOR else ""
+_RESET = Style.RESET_ALL if _USE_COLOR else ""
+_RULE = "----------------------------------------"
+
+_CONFIRM_MENU = (
+    "\n=== Confirm Character ===\n"
+    "1. Change Race\n"
+    "2. Change Class\n"
+    "3. Change Spells\n"
+    "4. Reroll Stats\n"
+    "5. Confirm Character"
+)
+
+_STAT_METHOD_MENU = (
+    "=== Select Stat Allocation Method ===\n"
+    "1. Random Allocation\n"
+    "     Randomly allocate 30 points (min 1, max 12 before modifiers).\n"
+    "2. Allocate Points Manually\n"
+    "     Distribute 25 points (start at 6, min 4, max 15 before modifiers).\n"
+    + _RULE
+)
+
+# Fixed ability order for stat arrays (base rolls, racial bonuses, finals).
+_STAT_ORDER = ("Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma")
+_STAT_IDX = {name: i for i, name in enumerate(_STAT_ORDER)}
+_STR, _DEX, _CON, _INT, _WIS, _CHA = range(6)
+
+# One-line blurb per ability (in _STAT_ORDER) for the manual allocation screen.
+_STAT_DESCRIPTIONS = (
+    "Affects melee attack/damage, carry capacity.",
+    "Affects AC, ranged attacks, Reflex/stealth.",
+    "Affects HP, Fortitude, endurance.",
+    "Affects Wizard spells, skill points, knowledge.",
+    "Affects Cleric/Druid spells, Will, perception.",
+    "Affects Sorcerer/Bard spells, social, leadership.",
+)
+
+# Tiered point-buy cost by stat value (credits for <6, escalating cost >12).
+# Indexed directly by value 1..18; slot 0 is unused.
+_POINT_BUY_COSTS = (
+    0,
+    -5, -4, -3, -2, -1,
+    0, 1, 2, 3, 4, 5, 6,
+    8, 10, 12,
+    15, 18, 21,
+)
+# _DELTA_COSTS[cur][new]: points spent (negative: refunded) moving a stat from
+# cur to new. Each row rises with new, so rows can be bisected by budget.
+_DELTA_COSTS = tuple(tuple(new - cur for new in _POINT_BUY_COSTS) for cur in _POINT_BUY_COSTS)
+
+# Class primary stat (index into _STAT_ORDER); the random allocator gives it a floor.
+_PREFERRED_IDX = {
+    "Barbarian": _STR,
+    "Bard": _CHA,
+    "Cleric": _WIS,
+    "Druid": _WIS,
+    "Fighter": _STR,
+    "Monk": _DEX,
+    "Paladin": _CHA,
+    "Ranger": _DEX,
+    "Rogue": _DEX,
+    "Sorcerer": _CHA,
+    "Wizard": _INT,
+    "Assassin": _DEX,
+}
+# Same preference by ability name, for the class menu.
+_PREFERRED_STAT = {cls: _STAT_ORDER[idx] for cls, idx in _PREFERRED_IDX.items()}
+
+
+def _cprint(msg: str, color: str = _CYAN) -> None:
+    """Print `msg` in `color` (plain text when colors are off)."""
+    print(f"{color}{msg}{_RESET}")
+
+
+def _cinput(prompt: str) -> str:
+    """input() with the yellow prompt style used by the menus."""
+    return input(f"{_YELLOW}{prompt}{_RESET}")
+
 # -----------------------------------------------------------------------------
 # Built-in minimal races (used if races.json missing/invalid/empty)
 # -----------------------------------------------------------------------------
-DEFAULT_RACES: List[Dict[str, Any]] = [
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists to read-only MappingProxyType/tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Inverse of _freeze: build plain, mutable dicts/lists (e.g. for json.dump)."""
+    if isinstance(obj, Mapping):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+# Frozen so the shared module-level copy can never be mutated through a
+# caller that received it as a fallback; use _thaw() for a mutable copy.
+DEFAULT_RACES: Tuple[Mapping[str, Any], ...] = _freeze([
     {
         "name": "Human",
         "description": "Adaptable and ambitious.",
@@ -79,12 +204,54 @@ DEFAULT_RACES: List[Dict[str, Any]] = [
             }
         }
     }
-]
+])
+
+
+# Minimal built-in spell pools, used if spells.json is missing or has no entry for a class.
+_DEFAULT_SPELLS: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+    "Assassin": {
+        "0": [],
+        "1": [
+            {"name": "Disguise Self", "description": "Change your appearance.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+            {"name": "Silent Image", "description": "Create an illusion.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+            {"name": "Ghost Sound", "description": "Minor sounds or music.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+        ],
+    },
+    "Wizard": {
+        "0": [
+            {"name": "Prestidigitation", "description": "Minor tricks.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
+            {"name": "Mage Hand", "description": "Move 5 lb. at range.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
+            {"name": "Detect Magic", "description": "Sense magic.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
+            {"name": "Light", "description": "Object glows.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
+        ],
+        "1": [
+            {"name": "Magic Missile", "description": "Auto-hit force darts.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+            {"name": "Shield", "description": "+4 AC; block missiles.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+            {"name": "Charm Person", "description": "Turns target friendly.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+            {"name": "Burning Hands", "description": "Close cone fire.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
+        ],
+    },
+    "Cleric": {
+        "0": [
+            {"name": "Guidance", "description": "+1 to next roll.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
+            {"name": "Light", "description": "Object glows.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
+            {"name": "Detect Magic", "description": "Sense magic.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
+            {"name": "Create Water", "description": "Conjure clean water.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
+        ],
+        "1": [
+            {"name": "Bless", "description": "+1 attacks; vs fear.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
+            {"name": "Cure Light Wounds", "description": "Heal 1d8+1/level.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
+            {"name": "Shield of Faith", "description": "+2 deflection.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
+            {"name": "Command", "description": "1-round compulsion.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
+        ],
+    },
+}
 
 
 # -----------------------------------------------------------------------------
 # Path helpers + safe JSON loader
 # -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def _pkg_root() -> str:
     """
     Resolve the absolute path to the dnd_adventure package root.
@@ -97,14 +264,106 @@ def _pkg_root() -> str:
     return os.path.abspath(os.path.join(here, os.pardir))
 
 
+@functools.lru_cache(maxsize=None)
+def _data_path(filename: str) -> str:
+    """Absolute path of a file in <package_root>/data (e.g. races.json)."""
+    return os.path.join(_pkg_root(), "data", filename)
+
+
+# path -> (mtime_ns, parsed data); data files are static for a session, so
+# repeat loads only cost a stat() unless the file has been edited.
+_JSON_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _compiled_path(path: str) -> str:
+    """Pickled copy of a data/*.json file, kept in data/cache/ next to the map caches."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), "cache", f"{name}.pkl")
+
+
+# Directories already created (or found) this session, so makedirs runs once per dir.
+_DIRS_ENSURED: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path not in _DIRS_ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_ENSURED.add(path)
+
+
+def _load_compiled(path: str, mtime_ns: int):
+    """Return the pickled copy of `path` if it is at least as new as the JSON, else None."""
+    compiled = _compiled_path(path)
+    try:
+        if os.stat(compiled).st_mtime_ns < mtime_ns:
+            return None
+        with open(compiled, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache: just parse the JSON.
+        return None
+
+
+def _store_compiled(path: str, data: Any) -> None:
+    """Best-effort write of the pickled copy; failures only cost the next startup a parse."""
+    compiled = _compiled_path(path)
+    # Write a temp file and swap it in (as game_world's _atomic_write does), so
+    # a reader never sees a partial pickle and a crash never leaves a truncated
+    # cache newer than the JSON. The name is per thread, since the prefetch
+    # thread and the main thread can both miss the cache at once.
+    tmp_path = f"{compiled}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        _ensure_dir(os.path.dirname(compiled))
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, compiled)
+    except Exception as e:
+        logger.debug("Could not write compiled cache %s: %s", compiled, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _intern_strings(obj: Any) -> Any:
+    """
+    Intern dict keys and "name" values in parsed data (race, subrace, ability
+    and spell names repeat throughout), so duplicates share one object and
+    compare by identity. Returns a new structure; scalars pass through.
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k):
+                (sys.intern(v) if k == "name" and isinstance(v, str) else _intern_strings(v))
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_strings(v) for v in obj]
+    return obj
+
+
 def _safe_load_json(path: str, default):
     """
     Load JSON with robust error handling. If file is missing or invalid,
     return the provided default so callers always get a usable object.
+    Parsed results are cached per file and shared; treat them as read-only.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = _JSON_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # A pickled copy from a previous run skips JSON tokenizing entirely.
+        data = _load_compiled(path, mtime_ns)
+        if data is None:
+            with open(path, "rb") as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both.
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _store_compiled(path, data)
+        data = _intern_strings(data)
+        _JSON_CACHE[path] = (mtime_ns, data)
+        return data
     except FileNotFoundError:
         logger.warning(f"Missing file: {path} — using defaults.")
         return default
@@ -132,32 +391,137 @@ class PlayerManager:
 
     def __init__(self) -> None:
         """
-        Initialize the manager and load (or create) the races data.
-        We target: <package_root>/data/races.json
+        Initialize the manager. Races are loaded on first use (see `races`),
+        so building a PlayerManager at startup does no file IO.
+        """
+        # Per-class memo of derived metadata; see _class_cache().
+        self._cached_classes: Optional[Dict[str, Any]] = None
+        self._class_caches: Dict[str, Dict[str, Any]] = {}
+
+    def prefetch_data(self) -> None:
+        """
+        Parse races.json and spells.json on a background thread so the work
+        overlaps with the player reading the start menu. The results land in
+        the shared _safe_load_json cache; nothing here is required for
+        correctness, and the creation flow loads synchronously as before.
         """
-        package_root = _pkg_root()
-        data_dir = os.path.join(package_root, "data")
-        os.makedirs(data_dir, exist_ok=True)
+        def _warm() -> None:
+            for name in ("races.json", "spells.json"):
+                path = _data_path(name)
+                if os.path.exists(path):
+                    _safe_load_json(path, None)
 
-        races_path = os.path.join(data_dir, "races.json")
-        logger.debug(f"Loading races from {races_path}...")
+        threading.Thread(target=_warm, name="player-data-prefetch", daemon=True).start()
 
-        # If missing, write the defaults so the game can proceed.
+    @functools.cached_property
+    def races(self) -> List[Dict[str, Any]]:
+        """
+        Race data from <package_root>/data/races.json, loaded (or created) on
+        first access.
+        """
+        races_path = _data_path("races.json")
+        logger.debug("Loading races from %s...", races_path)
+
+        # If missing, write the defaults so the game can proceed. The data dir
+        # only needs creating on this path.
         if not os.path.exists(races_path):
             logger.warning(f"races.json missing at {races_path}; writing minimal defaults.")
             try:
+                _ensure_dir(os.path.dirname(races_path))
                 with open(races_path, "w", encoding="utf-8") as f:
-                    json.dump(DEFAULT_RACES, f, indent=2)
+                    json.dump(_thaw(DEFAULT_RACES), f, indent=2)
             except OSError as e:
                 logger.error(f"Failed writing default races.json: {e}")
 
         # Load (never returns None thanks to _safe_load_json)
-        self.races: List[Dict[str, Any]] = _safe_load_json(races_path, DEFAULT_RACES)
+        races = _safe_load_json(races_path, DEFAULT_RACES)
 
         # Guard: if it parsed but is empty list, restore defaults
-        if not self.races:
+        if not races:
             logger.warning("races.json loaded but empty; injecting minimal defaults.")
-            self.races = DEFAULT_RACES
+            races = DEFAULT_RACES
+
+        # The defaults are frozen and shared; this manager gets its own mutable copy.
+        if races is DEFAULT_RACES:
+            races = _thaw(DEFAULT_RACES)
+        return races
+
+    @functools.cached_property
+    def _races_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Race lookups are case-insensitive by name; index once instead of
+        scanning self.races on every lookup. Keys are interned lowercase names.
+        """
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for r in self.races:
+            key = sys.intern(r["name"].lower())
+            if key in by_name:
+                logger.warning("Duplicate race name %r in races data; keeping the first entry.", r["name"])
+                continue
+            by_name[key] = r
+        return by_name
+
+    @functools.cached_property
+    def _race_keys(self) -> Dict[str, str]:
+        """Exact race name (as shown in menus) -> its _races_by_name key."""
+        return {sys.intern(r["name"]): sys.intern(r["name"].lower()) for r in self.races}
+
+    def _race_dict(self, race: str) -> Optional[Dict[str, Any]]:
+        """Return the race entry named `race` (case-insensitive), or None."""
+        # Names coming back from the race menu hit _race_keys and skip .lower().
+        key = self._race_keys.get(race)
+        return self._races_by_name.get(key if key is not None else race.lower())
+
+    @functools.cached_property
+    def _race_mod_strs(self) -> List[str]:
+        """Formatted stat-modifier line per race (parallel to self.races) for the race menu."""
+        return [self._format_modifiers(r.get("ability_modifiers", {})) or "None" for r in self.races]
+
+    @functools.cached_property
+    def _race_menu(self) -> str:
+        """The full race menu, rendered once; races do not change after loading."""
+        lines = ["=== Select Your Race ==="]
+        for i, (race, mod_str) in enumerate(zip(self.races, self._race_mod_strs), 1):
+            lines += (
+                _RULE,
+                f"{i}. {race['name']}",
+                f"     {race.get('description', '')}",
+                f"     Stat Modifiers: {mod_str}",
+            )
+        lines.append(_RULE)
+        return "\n".join(lines)
+
+    @functools.cached_property
+    def _modifier_cache(self) -> Dict[Tuple[str, Optional[str]], Tuple[Dict[str, int], Dict[str, int], Mapping[str, int], Tuple[int, ...]]]:
+        return {}
+
+    def _racial_modifiers(
+        self, race: str, subrace: Optional[str]
+    ) -> Tuple[Dict[str, int], Dict[str, int], Mapping[str, int], Tuple[int, ...]]:
+        """
+        Return (race modifiers, subrace modifiers, combined modifiers, bonus
+        vector in _STAT_ORDER) for a race/subrace pair. Memoized per pair,
+        since the creation loop asks again after every reroll or spell change;
+        treat the result as read-only.
+        """
+        key = (race, subrace)
+        cached = self._modifier_cache.get(key)
+        if cached is None:
+            race_dict = self._race_dict(race) or {}
+            subrace_dict = race_dict.get("subraces", {}).get(subrace, {}) if subrace else {}
+            race_modifiers = race_dict.get("ability_modifiers", {})
+            subrace_modifiers = subrace_dict.get("ability_modifiers", {})
+
+            combined_modifiers: Dict[str, int] = {}
+            for stat, value in race_modifiers.items():
+                combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
+            for stat, value in subrace_modifiers.items():
+                combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
+
+            bonus_vector = tuple(combined_modifiers.get(stat, 0) for stat in _STAT_ORDER)
+            cached = (race_modifiers, subrace_modifiers, MappingProxyType(combined_modifiers), bonus_vector)
+            self._modifier_cache[key] = cached
+        return cached
 
     # -------------------------------------------------------------------------
     # Public API: create or load player
@@ -169,39 +533,35 @@ class PlayerManager:
         Returns:
             (Player instance or None, starting_room_id as "x,y" or None)
         """
-        logger.debug(f"Initializing player, save_file={save_file}")
+        logger.debug("Initializing player, save_file=%s", save_file)
 
         # Attempt load if a save file name was provided
         if save_file:
             try:
                 player_data = game.save_manager.load_game(save_file)
                 if player_data:
+                    # Positional, in Player's field order (name, race, subrace,
+                    # class, stats, spells, level, features, subclass).
                     player = Player(
-                        name=player_data["name"],
-                        race=player_data["race"],
-                        subrace=player_data["subrace"],
-                        character_class=player_data["class"],
-                        stats=player_data["stats"],
-                        spells=player_data.get("spells", {0: [], 1: []}),
-                        level=player_data.get("level", 1),
-                        features=player_data.get("features", []),
-                        subclass=player_data.get("subclass", None),
+                        player_data["name"],
+                        player_data["race"],
+                        player_data["subrace"],
+                        player_data["class"],
+                        player_data["stats"],
+                        player_data.get("spells", {0: [], 1: []}),
+                        player_data.get("level", 1),
+                        player_data.get("features", []),
+                        player_data.get("subclass"),
                     )
                     starting_room = player_data.get("current_room")
-                    logger.debug(f"Loaded player: {player_data['name']}, room: {starting_room}")
+                    logger.debug("Loaded player: %s, room: %s", player_data['name'], starting_room)
                     return player, starting_room
             except Exception as e:
                 logger.error(f"Failed to load save file {save_file}: {e}")
-                try:
-                    print(f"{Fore.RED}Failed to load save file. Starting new character.{Style.RESET_ALL}")
-                except OSError:
-                    print("Failed to load save file. Starting new character.")
+                _cprint("Failed to load save file. Starting new character.", _RED)
 
         # Otherwise enter full creation flow
-        try:
-            print(f"{Fore.CYAN}Creating new character...{Style.RESET_ALL}")
-        except OSError:
-            print("Creating new character...")
+        _cprint("Creating new character...")
 
         player_data = self._create_character(game)
         if not player_data:
@@ -210,15 +570,15 @@ class PlayerManager:
 
         # Build Player object
         player = Player(
-            name=getattr(game, "player_name", "Hero"),
-            race=player_data["race"],
-            subrace=player_data["subrace"],
-            character_class=player_data["class"],
-            stats=player_data["stats"],
-            spells=player_data["spells"],
-            level=player_data.get("level", 1),
-            features=player_data["features"],
-            subclass=player_data.get("subclass", None),
+            getattr(game, "player_name", "Hero"),
+            player_data["race"],
+            player_data["subrace"],
+            player_data["class"],
+            player_data["stats"],
+            player_data["spells"],
+            player_data.get("level", 1),
+            player_data["features"],
+            player_data.get("subclass"),
         )
 
         # Choose a starting position (first dungeon; else 0,0)
@@ -245,7 +605,7 @@ class PlayerManager:
         subrace: Optional[str] = None
         character_class: Optional[str] = None
         subclass: Optional[str] = None
-        stats: Optional[List[int]] = None
+        stats: Optional[Tuple[int, ...]] = None  # base array; replaced wholesale on reroll, never mutated
         spells: Dict[int, List[str]] = {0: [], 1: []}
         features: List[str] = []
         level = 1  # starting level
@@ -270,40 +630,14 @@ class PlayerManager:
 
             # 3) Base Stat array (random/manual) -------------------------------
             if not stats:
-                stats = self._choose_stats(race, subrace, character_class)
+                stats = tuple(self._choose_stats(race, subrace, character_class))
 
             # 4) Compose racial/subrace modifiers for display & math -----------
-            race_dict = next((r for r in self.races if r["name"].lower() == race.lower()), {})
-            subrace_dict = race_dict.get("subraces", {}).get(subrace, {}) if subrace else {}
-            race_modifiers = race_dict.get("ability_modifiers", {})
-            subrace_modifiers = subrace_dict.get("ability_modifiers", {})
+            race_modifiers, subrace_modifiers, combined_modifiers, bonus_vector = self._racial_modifiers(race, subrace)
 
-            combined_modifiers: Dict[str, int] = {}
-            for stat, value in race_modifiers.items():
-                combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
-            for stat, value in subrace_modifiers.items():
-                combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
-
-            # 5) Build labeled dict, then compute final list in fixed order ----
-            stat_dict = {
-                "Strength":      stats[0],
-                "Dexterity":     stats[1],
-                "Constitution":  stats[2],
-                "Intelligence":  stats[3],
-                "Wisdom":        stats[4],
-                "Charisma":      stats[5],
-            }
-            for stat, value in combined_modifiers.items():
-                stat_dict[stat] = stat_dict.get(stat, 6) + value
-
-            final_stats = [
-                stat_dict["Strength"],
-                stat_dict["Dexterity"],
-                stat_dict["Constitution"],
-                stat_dict["Intelligence"],
-                stat_dict["Wisdom"],
-                stat_dict["Charisma"],
-            ]
+            # 5) Final list in fixed order, plus the labeled dict -------------
+            final_stats = [base + bonus for base, bonus in zip(stats, bonus_vector)]
+            stat_dict = dict(zip(_STAT_ORDER, final_stats))
 
             # 6) Class metadata (features/spellcasting) ------------------------
             class_data = game.classes.get(character_class, {})
@@ -318,125 +652,62 @@ class PlayerManager:
                 features = self._get_class_features(game, character_class)
 
             # 9) Derived stats (simple, consistent math) -----------------------
-            max_hp = self._calculate_hp(class_data, stat_dict)
+            max_hp, max_mp, attack, defense = self._calculate_derived(class_data, final_stats)
             current_hp = max_hp
-            max_mp = self._calculate_mp(class_data, stat_dict)
             current_mp = max_mp
-            attack = self._calculate_attack(class_data, stat_dict)
-            defense = self._calculate_defense(stat_dict)
 
             # 10) Preview + Confirm menu --------------------------------------
-            try:
-                print(f"{Fore.CYAN}=== Character Summary ==={Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Name: {getattr(game, 'player_name', 'Hero')}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Level: {level}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Race: {race} ({subrace or 'None'}){Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Racial Stat Bonus: {self._format_modifiers(combined_modifiers) or 'None'}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}HP: {current_hp}/{max_hp}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}MP: {current_mp}/{max_mp}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Attack Bonus: {attack}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}AC: {defense}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Class: {character_class}{Style.RESET_ALL}")
-
-                print(f"\n{Fore.CYAN}=== Base Stats (before racial) ==={Style.RESET_ALL}")
-                for label, value in zip(["Strength","Dexterity","Constitution","Intelligence","Wisdom","Charisma"], stats):
-                    print(f"{Fore.CYAN}{label}: {value}{Style.RESET_ALL}")
-
-                print(f"\n{Fore.CYAN}=== Racial/Subrace Bonuses Applied ==={Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Race ({race}): {self._format_modifiers(race_modifiers) or 'None'}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Subrace ({subrace or 'None'}): {self._format_modifiers(subrace_modifiers) or 'None'}{Style.RESET_ALL}")
-
-                # Subclass visibility (info only)
-                print(f"\n{Fore.CYAN}=== Available Subclasses at Level 1 ==={Style.RESET_ALL}")
-                subclasses = class_data.get('subclasses', {})
-                if subclasses:
-                    for sc_name, data in subclasses.items():
-                        prereqs = data.get('prerequisites', {})
-                        level_req = prereqs.get('level', 1)
-                        stat_reqs = prereqs.get('stats', {})
-                        meets_stats = all(stat_dict.get(stat, 10) >= value for stat, value in stat_reqs.items())
-                        status = "Unlocked" if level_req == 1 and meets_stats else "Locked"
-                        print(f"{Fore.CYAN}  {sc_name} ({status}): {data.get('description', '')}{Style.RESET_ALL}")
-                        if status == "Locked":
-                            print(f"{Fore.CYAN}    Requirements:{Style.RESET_ALL}")
-                            print(f"{Fore.CYAN}      - Level: {level_req}{Style.RESET_ALL}")
-                            for s, v in stat_reqs.items():
-                                print(f"{Fore.CYAN}      - {s}: {v}{Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.CYAN}  None{Style.RESET_ALL}")
+            # Assembled as one block and written with a single call per redraw.
+            lines: List[str] = []
+            add = lines.append
+            add("=== Character Summary ===")
+            add(f"Name: {getattr(game, 'player_name', 'Hero')}")
+            add(f"Level: {level}")
+            add(f"Race: {race} ({subrace or 'None'})")
+            add(f"Racial Stat Bonus: {self._format_modifiers(combined_modifiers) or 'None'}")
+            add(f"HP: {current_hp}/{max_hp}")
+            add(f"MP: {current_mp}/{max_mp}")
+            add(f"Attack Bonus: {attack}")
+            add(f"AC: {defense}")
+            add(f"Class: {character_class}")
+
+            add("\n=== Base Stats (before racial) ===")
+            lines.extend(f"{label}: {value}" for label, value in zip(_STAT_ORDER, stats))
+
+            add("\n=== Racial/Subrace Bonuses Applied ===")
+            add(f"Race ({race}): {self._format_modifiers(race_modifiers) or 'None'}")
+            add(f"Subrace ({subrace or 'None'}): {self._format_modifiers(subrace_modifiers) or 'None'}")
+
+            # Subclass visibility (info only)
+            add("\n=== Available Subclasses at Level 1 ===")
+            subclass_reqs = self._subclass_requirements(game, character_class)
+            if subclass_reqs:
+                for sc_name, description, level_req, stat_reqs, min_stats in subclass_reqs:
+                    meets_stats = min_stats is not None and all(final_stats[i] >= need for i, need in min_stats)
+                    status = "Unlocked" if level_req == 1 and meets_stats else "Locked"
+                    add(f"  {sc_name} ({status}): {description}")
+                    if status == "Locked":
+                        add("    Requirements:")
+                        add(f"      - Level: {level_req}")
+                        lines.extend(f"      - {s}: {v}" for s, v in stat_reqs.items())
+            else:
+                add("  None")
 
-                print(f"\n{Fore.CYAN}=== Final Stats (after racial) ==={Style.RESET_ALL}")
-                for k, v in stat_dict.items():
-                    print(f"{Fore.CYAN}{k}: {v}{Style.RESET_ALL}")
+            add("\n=== Final Stats (after racial) ===")
+            lines.extend(f"{k}: {v}" for k, v in stat_dict.items())
 
-                print(f"\n{Fore.CYAN}=== Spells ==={Style.RESET_ALL}")
-                if spells[0] or spells[1]:
-                    print(f"{Fore.CYAN}Level 0: {', '.join(spells[0]) or 'None'}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}Level 1: {', '.join(spells[1]) or 'None'}{Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.CYAN}None{Style.RESET_ALL}")
-
-                print(f"\n{Fore.CYAN}=== Confirm Character ==={Style.RESET_ALL}")
-                print(f"{Fore.CYAN}1. Change Race{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}2. Change Class{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}3. Change Spells{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}4. Reroll Stats{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}5. Confirm Character{Style.RESET_ALL}")
-                choice = input(f"{Fore.YELLOW}Select an option (1-5): {Style.RESET_ALL}").strip().lower()
-
-            except OSError:
-                # Fallback without ANSI
-                print("=== Character Summary ===")
-                print(f"Name: {getattr(game, 'player_name', 'Hero')}")
-                print(f"Level: {level}")
-                print(f"Race: {race} ({subrace or 'None'})")
-                print(f"Racial Stat Bonus: {self._format_modifiers(combined_modifiers) or 'None'}")
-                print(f"HP: {current_hp}/{max_hp}")
-                print(f"MP: {current_mp}/{max_mp}")
-                print(f"Attack Bonus: {attack}")
-                print(f"AC: {defense}")
-                print(f"Class: {character_class}")
-                print("\n=== Base Stats (before racial) ===")
-                for label, value in zip(["Strength","Dexterity","Constitution","Intelligence","Wisdom","Charisma"], stats):
-                    print(f"{label}: {value}")
-                print("\n=== Racial/Subrace Bonuses Applied ===")
-                print(f"Race ({race}): {self._format_modifiers(race_modifiers) or 'None'}")
-                print(f"Subrace ({subrace or 'None'}): {self._format_modifiers(subrace_modifiers) or 'None'}")
-                print("\n=== Available Subclasses at Level 1 ===")
-                subclasses = class_data.get('subclasses', {})
-                if subclasses:
-                    for sc_name, data in subclasses.items():
-                        prereqs = data.get('prerequisites', {})
-                        level_req = prereqs.get('level', 1)
-                        stat_reqs = prereqs.get('stats', {})
-                        meets_stats = all(stat_dict.get(stat, 10) >= value for stat, value in stat_reqs.items())
-                        status = "Unlocked" if level_req == 1 and meets_stats else "Locked"
-                        print(f"  {sc_name} ({status}): {data.get('description', '')}")
-                        if status == "Locked":
-                            print("    Requirements:")
-                            print(f"      - Level: {level_req}")
-                            for s, v in stat_reqs.items():
-                                print(f"      - {s}: {v}")
-                else:
-                    print("  None")
-                print("\n=== Final Stats (after racial) ===")
-                for k, v in stat_dict.items():
-                    print(f"{k}: {v}")
-                print("\n=== Spells ===")
-                if spells[0] or spells[1]:
-                    print(f"Level 0: {', '.join(spells[0]) or 'None'}")
-                    print(f"Level 1: {', '.join(spells[1]) or 'None'}")
-                else:
-                    print("None")
-                print("\n=== Confirm Character ===")
-                print("1. Change Race")
-                print("2. Change Class")
-                print("3. Change Spells")
-                print("4. Reroll Stats")
-                print("5. Confirm Character")
-                choice = input("Select an option (1-5): ").strip().lower()
-
-            logger.debug(f"Confirmation menu choice: {choice}")
+            add("\n=== Spells ===")
+            if spells[0] or spells[1]:
+                add(f"Level 0: {', '.join(spells[0]) or 'None'}")
+                add(f"Level 1: {', '.join(spells[1]) or 'None'}")
+            else:
+                add("None")
+
+            add(_CONFIRM_MENU)
+            _cprint("\n".join(lines))
+            choice = _cinput("Select an option (1-5): ").strip().lower()
+
+            logger.debug("Confirmation menu choice: %s", choice)
             if choice == '1':
                 race = None
                 subrace = None
@@ -452,10 +723,7 @@ class PlayerManager:
                 if class_data.get("spellcasting"):
                     spells = self._select_spells(game, character_class)
                 else:
-                    try:
-                        print(f"{Fore.RED}This class cannot cast spells.{Style.RESET_ALL}")
-                    except OSError:
-                        print("This class cannot cast spells.")
+                    _cprint("This class cannot cast spells.", _RED)
                 continue
             elif choice == '4':
                 stats = None
@@ -480,64 +748,45 @@ class PlayerManager:
                     "level": level,
                 }
             else:
-                try:
-                    print(f"{Fore.RED}Invalid choice. Please select 1-5.{Style.RESET_ALL}")
-                except OSError:
-                    print("Invalid choice. Please select 1-5.")
+                _cprint("Invalid choice. Please select 1-5.", _RED)
 
     # -------------------------------------------------------------------------
     # Simple derived-stat calculators (consistent & predictable)
     # -------------------------------------------------------------------------
-    def _calculate_hp(self, class_data: Dict[str, Any], stat_dict: Dict[str, int]) -> int:
+    def _calculate_derived(self, class_data: Dict[str, Any], stats: List[int]) -> Tuple[int, int, int, int]:
         """
-        Max HP at L1 = class hit die + CON modifier (min 1).
+        Level-1 (max HP, max MP, attack bonus, AC) in one pass over the class data:
+        • HP = class hit die + CON modifier (min 1)
+        • MP = 2 + casting-stat modifier for casters (min 0), else 0
+        • Attack = (very rough BAB by progression) + better of STR/DEX mod (min 0)
+        • AC = 10 + DEX modifier (no armor system yet)
         """
-        hit_die = class_data.get("hit_die", 6)
-        con_modifier = (stat_dict.get("Constitution", 10) - 10) // 2
-        max_hp = hit_die + con_modifier
-        return max(max_hp, 1)
+        dex_mod = (stats[_DEX] - 10) // 2
+        str_mod = (stats[_STR] - 10) // 2
 
-    def _calculate_mp(self, class_data: Dict[str, Any], stat_dict: Dict[str, int]) -> int:
-        """
-        Simple MP pool for caster classes.
-        """
-        if not class_data.get("spellcasting"):
-            return 0
-        primary_stat = class_data.get("spellcasting_stat", "Intelligence")
-        stat_modifier = (stat_dict.get(primary_stat, 10) - 10) // 2
-        return max(2 + stat_modifier, 0)
+        max_hp = max(class_data.get("hit_die", 6) + (stats[_CON] - 10) // 2, 1)
 
-    def _calculate_attack(self, class_data: Dict[str, Any], stat_dict: Dict[str, int]) -> int:
-        """
-        Attack bonus = (very rough BAB by progression) + better of STR/DEX mod.
-        """
-        bab = 0
-        prog = class_data.get("bab_progression")
-        if prog == "fast":
-            bab = 1
-        elif prog == "medium":
-            bab = 0
-        # 'slow' or unspecified -> 0 at level 1
-        dex_mod = (stat_dict.get("Dexterity", 10) - 10) // 2
-        str_mod = (stat_dict.get("Strength", 10) - 10) // 2
-        return max(bab + max(dex_mod, str_mod), 0)
-
-    def _calculate_defense(self, stat_dict: Dict[str, int]) -> int:
-        """
-        AC = 10 + DEX modifier (no armor system yet).
-        """
-        dex_modifier = (stat_dict.get("Dexterity", 10) - 10) // 2
-        return 10 + dex_modifier
+        max_mp = 0
+        if class_data.get("spellcasting"):
+            primary_idx = _STAT_IDX.get(class_data.get("spellcasting_stat", "Intelligence"))
+            stat_modifier = (stats[primary_idx] - 10) // 2 if primary_idx is not None else 0
+            max_mp = max(2 + stat_modifier, 0)
+
+        # 'fast' gets +1 at level 1; 'medium', 'slow' or unspecified -> 0
+        bab = 1 if class_data.get("bab_progression") == "fast" else 0
+        attack = max(bab + max(dex_mod, str_mod), 0)
+
+        return max_hp, max_mp, attack, 10 + dex_mod
 
     # -------------------------------------------------------------------------
     # Subclass selection (unlocked at L1 only if requirements met)
     # -------------------------------------------------------------------------
     def _select_subclass(self, game: Any, character_class: str, level: int) -> Optional[str]:
-        logger.debug(f"Selecting subclass for {character_class}")
+        logger.debug("Selecting subclass for %s", character_class)
         class_data = game.classes.get(character_class, {})
         subclasses = class_data.get("subclasses", {})
         if not subclasses:
-            logger.debug(f"No subclasses available for {character_class}")
+            logger.debug("No subclasses available for %s", character_class)
             return None
 
         unlocked: List[Tuple[str, Dict[str, Any]]] = []
@@ -548,30 +797,21 @@ class PlayerManager:
                 unlocked.append((subclass_name, data))
 
         if not unlocked:
-            logger.debug(f"No unlocked subclasses for {character_class} at level {level}")
+            logger.debug("No unlocked subclasses for %s at level %s", character_class, level)
             return None
 
+        # The menu text does not change between retries; render it once.
+        lines = ["=== Select Your Subclass (or None) ==="]
+        for i, (sc_name, data) in enumerate(unlocked, 1):
+            lines += (_RULE, f"{i}. {sc_name}", f"     {data.get('description', '')}")
+        lines += (_RULE, f"{len(unlocked) + 1}. None")
+        menu = "\n".join(lines)
+
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Select Your Subclass (or None) ==={Style.RESET_ALL}")
-                for i, (sc_name, data) in enumerate(unlocked, 1):
-                    print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}{i}. {sc_name}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {data.get('description', '')}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}{len(unlocked) + 1}. None{Style.RESET_ALL}")
-                selection = input(f"{Fore.YELLOW}Select subclass (1-{len(unlocked)+1}): {Style.RESET_ALL}").strip()
-            except OSError:
-                print("=== Select Your Subclass (or None) ===")
-                for i, (sc_name, data) in enumerate(unlocked, 1):
-                    print("----------------------------------------")
-                    print(f"{i}. {sc_name}")
-                    print(f"     {data.get('description', '')}")
-                print("----------------------------------------")
-                print(f"{len(unlocked)+1}. None")
-                selection = input(f"Select subclass (1-{len(unlocked)+1}): ").strip()
-
-            logger.debug(f"Selected subclass: {selection}")
+            _cprint(menu)
+            selection = _cinput(f"Select subclass (1-{len(unlocked)+1}): ").strip()
+
+            logger.debug("Selected subclass: %s", selection)
             if selection.isdigit():
                 idx = int(selection) - 1
                 if 0 <= idx < len(unlocked):
@@ -579,10 +819,7 @@ class PlayerManager:
                 elif idx == len(unlocked):
                     return None
 
-            try:
-                print(f"{Fore.RED}Invalid selection. Please enter a number (1-{len(unlocked)+1}).{Style.RESET_ALL}")
-            except OSError:
-                print(f"Invalid selection. Please enter a number (1-{len(unlocked)+1}).")
+            _cprint(f"Invalid selection. Please enter a number (1-{len(unlocked)+1}).", _RED)
 
     # -------------------------------------------------------------------------
     # Stat allocation (menu) → random or manual point-buy
@@ -594,63 +831,31 @@ class PlayerManager:
         • Manual allocation: 25-point buy (start at 6, 4..15 pre-mods)
         """
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Select Stat Allocation Method ==={Style.RESET_ALL}")
-                print(f"{Fore.CYAN}1. Random Allocation{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}     Randomly allocate 30 points (min 1, max 12 before modifiers).{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}2. Allocate Points Manually{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}     Distribute 25 points (start at 6, min 4, max 15 before modifiers).{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                choice = input(f"{Fore.YELLOW}Select method (1-2): {Style.RESET_ALL}").strip()
-            except OSError:
-                print("=== Select Stat Allocation Method ===")
-                print("1. Random Allocation")
-                print("     Randomly allocate 30 points (min 1, max 12 before modifiers).")
-                print("2. Allocate Points Manually")
-                print("     Distribute 25 points (start at 6, min 4, max 15 before modifiers).")
-                print("----------------------------------------")
-                choice = input("Select method (1-2): ").strip()
-
-            logger.debug(f"Selected stat method: {choice}")
+            _cprint(_STAT_METHOD_MENU)
+            choice = _cinput("Select method (1-2): ").strip()
+
+            logger.debug("Selected stat method: %s", choice)
             if choice == "1":
                 # Repeatedly roll a weighted array until the player accepts
                 while True:
                     stats = self._allocate_stats(race, subrace, character_class, point_pool=30, random_allocation=True)
-                    try:
-                        print(f"{Fore.CYAN}Generated Stats:{Style.RESET_ALL}")
-                        for stat, value in zip(
-                            ["Strength","Dexterity","Constitution","Intelligence","Wisdom","Charisma"], stats
-                        ):
-                            print(f"{Fore.CYAN}{stat}: {value}{Style.RESET_ALL}")
-                        accept = input(f"{Fore.YELLOW}Accept stats? (yes/no): {Style.RESET_ALL}").strip().lower()
-                    except OSError:
-                        print("Generated Stats:")
-                        for stat, value in zip(
-                            ["Strength","Dexterity","Constitution","Intelligence","Wisdom","Charisma"], stats
-                        ):
-                            print(f"{stat}: {value}")
-                        accept = input("Accept stats? (yes/no): ").strip().lower()
+                    _cprint("Generated Stats:\n" + "\n".join(f"{stat}: {value}" for stat, value in zip(_STAT_ORDER, stats)))
+                    accept = _cinput("Accept stats? (yes/no): ").strip().lower()
 
                     if accept == "yes":
                         return stats
                     elif accept != "no":
-                        try:
-                            print(f"{Fore.RED}Please enter 'yes' or 'no'.{Style.RESET_ALL}")
-                        except OSError:
-                            print("Please enter 'yes' or 'no'.")
+                        _cprint("Please enter 'yes' or 'no'.", _RED)
 
             elif choice == "2":
                 # Manual point-buy
                 return self._allocate_stats(race, subrace, character_class, point_pool=25, random_allocation=False)
 
             else:
-                try:
-                    print(f"{Fore.RED}Invalid choice. Please select 1 or 2.{Style.RESET_ALL}")
-                except OSError:
-                    print("Invalid choice. Please select 1 or 2.")
+                _cprint("Invalid choice. Please select 1 or 2.", _RED)
 
     # -------------------------------------------------------------------------
-    # Shared allocator used by random/manual modes (weighted costs)
+    # Point-buy allocators: random (weighted) and manual (menu)
     # -------------------------------------------------------------------------
     def _allocate_stats(
         self,
@@ -664,171 +869,115 @@ class PlayerManager:
         Flexible point-buy with tiered costs. In random mode, we bias toward
         viable mid-range arrays and give the class’ primary stat a floor.
         """
-        # Tiered cost map (credits for <6, escalating cost >12)
-        point_buy_costs = {
-            1: -5, 2: -4, 3: -3,
-            4: -2, 5: -1,
-            6: 0, 7: 1, 8: 2, 9: 3, 10: 4, 11: 5, 12: 6,
-            13: 8, 14: 10, 15: 12,
-            16: 15, 17: 18, 18: 21
-        }
-
-        # Bounds differ by mode
-        min_stat = 1 if random_allocation else 4
-        max_stat = 12 if random_allocation else 15
-        base_stat = 1 if random_allocation else 6
-        stats = [base_stat] * 6
-
-        # Compute combined racial modifiers (for UI)
-        race_dict = next((r for r in self.races if r["name"].lower() == race.lower()), {})
-        subrace_dict = race_dict.get("subraces", {}).get(subrace, {}) if subrace else {}
-        race_modifiers = race_dict.get("ability_modifiers", {})
-        subrace_modifiers = subrace_dict.get("ability_modifiers", {})
-
-        combined_modifiers: Dict[str, int] = {}
-        for stat, value in race_modifiers.items():
-            combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
-        for stat, value in subrace_modifiers.items():
-            combined_modifiers[stat] = combined_modifiers.get(stat, 0) + value
-
-        # Class primary stat preference
-        preferred_stats = {
-            "Barbarian": "Strength",
-            "Bard": "Charisma",
-            "Cleric": "Wisdom",
-            "Druid": "Wisdom",
-            "Fighter": "Strength",
-            "Monk": "Dexterity",
-            "Paladin": "Charisma",
-            "Ranger": "Dexterity",
-            "Rogue": "Dexterity",
-            "Sorcerer": "Charisma",
-            "Wizard": "Intelligence",
-            "Assassin": "Dexterity",
-        }
-        stat_names = ["Strength","Dexterity","Constitution","Intelligence","Wisdom","Charisma"]
-        preferred_stat = preferred_stats.get(character_class, "Intelligence")
-        preferred_idx = stat_names.index(preferred_stat)
-
         if random_allocation:
-            # Weighted random fill with a decent floor for the primary stat
-            unallocated_points = point_pool
-
-            preferred_value = min(12, max(10, random.randint(8, 12)))
-            stats[preferred_idx] = preferred_value
-            unallocated_points -= (point_buy_costs[preferred_value] - point_buy_costs[base_stat])
+            return self._random_allocate_stats(character_class, point_pool)
+        return self._manual_allocate_stats(race, subrace, point_pool)
+
+    def _random_allocate_stats(self, character_class: str, point_pool: int) -> List[int]:
+        """Weighted random buy over 1..12, with the class' primary stat at 10+."""
+        delta_costs = _DELTA_COSTS
+        min_stat, max_stat, base_stat = 1, 12, 1
+        # A plain list on purpose: array('b') would box an int on every read
+        # and is slower for this six-slot, read-heavy loop.
+        stats = [base_stat] * 6
+        preferred_idx = _PREFERRED_IDX.get(character_class, _INT)
 
-            possible_values = [v for v in point_buy_costs if min_stat <= v <= max_stat]
-            weights = [1 if v < 8 else 3 for v in possible_values]  # bias toward 8–12
+        # Weighted random fill with a decent floor for the primary stat
+        unallocated_points = point_pool
 
-            while unallocated_points > 0:
-                idx = random.randint(0, 5)
-                if stats[idx] >= max_stat:
-                    continue
-                # Find increases that fit remaining budget
-                next_values = [
-                    v for v in possible_values
-                    if v > stats[idx] and (point_buy_costs[v] - point_buy_costs[stats[idx]]) <= unallocated_points
-                ]
-                if not next_values:
-                    continue
-                # Map weights to the subset length
-                local_weights = weights[:len(next_values)]
-                new_val = random.choices(next_values, weights=local_weights, k=1)[0]
-                delta = point_buy_costs[new_val] - point_buy_costs[stats[idx]]
-                stats[idx] = new_val
-                unallocated_points -= delta
+        preferred_value = min(12, max(10, random.randint(8, 12)))
+        stats[preferred_idx] = preferred_value
+        unallocated_points -= delta_costs[base_stat][preferred_value]
+
+        weights = [1 if v < 8 else 3 for v in range(min_stat, max_stat + 1)]  # bias toward 8–12
+        # Running totals of the weights, so a pick is one bisect instead of
+        # random.choices rebuilding them on every step.
+        cum_weights = list(itertools.accumulate(weights))
+
+        # Stats that may still take a step. Values only rise and the budget
+        # only falls, so a stat that is maxed or cannot afford its next
+        # step never can again: drop it on the first miss instead of
+        # redrawing it, and stop once none are left.
+        live = list(range(6))
+        choice = random.choice
+        rand = random.random
+        while unallocated_points > 0 and live:
+            idx = choice(live)
+            current = stats[idx]
+            # The affordable increases are one contiguous run of values:
+            # current+1 up to the last whose delta fits the budget.
+            row = delta_costs[current]
+            lo = current + 1
+            hi = bisect.bisect_right(row, unallocated_points, lo, max_stat + 1)
+            if hi <= lo:
+                live.remove(idx)
+                continue
+            # Map weights to the subset length: the first n weights weigh
+            # the n candidates (same pick random.choices would make).
+            n = hi - lo
+            new_val = lo + bisect.bisect_right(cum_weights, rand() * cum_weights[n - 1], 0, n - 1)
+            stats[idx] = new_val
+            unallocated_points -= row[new_val]
+
+        logger.debug("Randomly allocated stats: %s", stats)
+        return stats
+
+    def _manual_allocate_stats(self, race: str, subrace: Optional[str], point_pool: int) -> List[int]:
+        """Interactive buy over 4..15 starting from 6; shows racial modifiers."""
+        delta_costs = _DELTA_COSTS
+        min_stat, max_stat, base_stat = 4, 15, 6
+        stats = [base_stat] * 6
 
-            logger.debug(f"Randomly allocated stats: {stats}")
-            return stats
+        # Combined racial modifiers (for UI)
+        combined_modifiers = self._racial_modifiers(race, subrace)[2]
 
-        # -------- Manual point-buy UI ----------------------------------------
         unallocated_points = point_pool
 
         def cost_to_increment(current: int) -> Optional[int]:
-            if current >= max_stat:
-                return None
-            nxt = current + 1
-            return point_buy_costs.get(nxt, float('inf')) - point_buy_costs.get(current, 0)
-
-        descriptions = [
-            "Affects melee attack/damage, carry capacity.",
-            "Affects AC, ranged attacks, Reflex/stealth.",
-            "Affects HP, Fortitude, endurance.",
-            "Affects Wizard spells, skill points, knowledge.",
-            "Affects Cleric/Druid spells, Will, perception.",
-            "Affects Sorcerer/Bard spells, social, leadership.",
-        ]
+            return delta_costs[current][current + 1] if current < max_stat else None
+
+        def render_row(i: int) -> str:
+            name, value = _STAT_ORDER[i], stats[i]
+            mod = (value + combined_modifiers.get(name, 0) - 10) // 2
+            c = cost_to_increment(value)
+            c_str = f"To increase to {value+1}: {c} points" if c is not None else "Maxed out"
+            return f"{i+1}. {name}: {value} ({'+' if mod >= 0 else ''}{mod})\n     {_STAT_DESCRIPTIONS[i]}\n     {c_str}"
+
+        # One change touches one stat, so only that row is re-rendered.
+        rows = [render_row(i) for i in range(6)]
 
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Manual Stat Allocation ==={Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Unallocated points: {unallocated_points}{Style.RESET_ALL}")
-                for i, (name, value, desc) in enumerate(zip(stat_names, stats, descriptions), 1):
-                    mod = (value + combined_modifiers.get(name, 0) - 10) // 2
-                    c = cost_to_increment(value)
-                    c_str = f"To increase to {value+1}: {c} points" if c is not None else "Maxed out"
-                    print(f"{Fore.CYAN}{i}. {name}: {value} ({'+' if mod >= 0 else ''}{mod}){Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {desc}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {c_str}{Style.RESET_ALL}")
-                selection = input(f"{Fore.YELLOW}Select stat (1-6) or 'done' to finalize: {Style.RESET_ALL}").strip().lower()
-            except OSError:
-                print("=== Manual Stat Allocation ===")
-                print(f"Unallocated points: {unallocated_points}")
-                for i, (name, value, desc) in enumerate(zip(stat_names, stats, descriptions), 1):
-                    mod = (value + combined_modifiers.get(name, 0) - 10) // 2
-                    c = cost_to_increment(value)
-                    c_str = f"To increase to {value+1}: {c} points" if c is not None else "Maxed out"
-                    print(f"{i}. {name}: {value} ({'+' if mod >= 0 else ''}{mod})")
-                    print(f"     {desc}")
-                    print(f"     {c_str}")
-                selection = input("Select stat (1-6) or 'done' to finalize: ").strip().lower()
+            _cprint(f"=== Manual Stat Allocation ===\nUnallocated points: {unallocated_points}\n" + "\n".join(rows))
+            selection = _cinput("Select stat (1-6) or 'done' to finalize: ").strip().lower()
 
             if selection == "done":
                 if unallocated_points > 0:
-                    try:
-                        print(f"{Fore.RED}You still have {unallocated_points} points unallocated.{Style.RESET_ALL}")
-                        finalize = input(f"{Fore.YELLOW}Finalize anyway? (yes/no): {Style.RESET_ALL}").strip().lower()
-                    except OSError:
-                        print(f"You still have {unallocated_points} points unallocated.")
-                        finalize = input("Finalize anyway? (yes/no): ").strip().lower()
+                    _cprint(f"You still have {unallocated_points} points unallocated.", _RED)
+                    finalize = _cinput("Finalize anyway? (yes/no): ").strip().lower()
                     if finalize == "yes":
-                        logger.debug(f"Finalized stats: {stats} (unused points: {unallocated_points})")
+                        logger.debug("Finalized stats: %s (unused points: %s)", stats, unallocated_points)
                         return stats
                     elif finalize != "no":
-                        try:
-                            print(f"{Fore.RED}Please enter 'yes' or 'no'.{Style.RESET_ALL}")
-                        except OSError:
-                            print("Please enter 'yes' or 'no'.")
+                        _cprint("Please enter 'yes' or 'no'.", _RED)
                     continue
-                try:
-                    finalize = input(f"{Fore.YELLOW}Finalize stats? (yes/no): {Style.RESET_ALL}").strip().lower()
-                except OSError:
-                    finalize = input("Finalize stats? (yes/no): ").strip().lower()
+                finalize = _cinput("Finalize stats? (yes/no): ").strip().lower()
                 if finalize == "yes":
-                    logger.debug(f"Finalized stats: {stats}")
+                    logger.debug("Finalized stats: %s", stats)
                     return stats
                 elif finalize != "no":
-                    try:
-                        print(f"{Fore.RED}Please enter 'yes' or 'no'.{Style.RESET_ALL}")
-                    except OSError:
-                        print("Please enter 'yes' or 'no'.")
+                    _cprint("Please enter 'yes' or 'no'.", _RED)
                 continue
 
             if not selection.isdigit() or not 1 <= int(selection) <= 6:
-                try:
-                    print(f"{Fore.RED}Invalid input. Select a number (1-6) or 'done'.{Style.RESET_ALL}")
-                except OSError:
-                    print("Invalid input. Select a number (1-6) or 'done'.")
+                _cprint("Invalid input. Select a number (1-6) or 'done'.", _RED)
                 continue
 
             idx = int(selection) - 1
             try:
-                prompt = (
-                    f"{Fore.YELLOW}Enter target value for {stat_names[idx]} ({min_stat}-{max_stat}) "
-                    f"or '+n'/'-n' to adjust (e.g., '+2', '-1'): {Style.RESET_ALL}"
-                )
-                raw = input(prompt).strip()
+                raw = _cinput(
+                    f"Enter target value for {_STAT_ORDER[idx]} ({min_stat}-{max_stat}) "
+                    f"or '+n'/'-n' to adjust (e.g., '+2', '-1'): "
+                ).strip()
 
                 if raw.startswith(("+", "-")):
                     delta = int(raw)
@@ -837,40 +986,28 @@ class PlayerManager:
                     target = int(raw)
 
                 if target < min_stat or target > max_stat:
-                    try:
-                        print(f"{Fore.RED}Value must be between {min_stat} and {max_stat}.{Style.RESET_ALL}")
-                    except OSError:
-                        print(f"Value must be between {min_stat} and {max_stat}.")
+                    _cprint(f"Value must be between {min_stat} and {max_stat}.", _RED)
                     continue
 
-                cost_new = point_buy_costs.get(target, float('inf'))
-                cost_old = point_buy_costs.get(stats[idx], 0)
-                delta_cost = cost_new - cost_old
+                # target was range-checked above, so it indexes the table safely
+                delta_cost = delta_costs[stats[idx]][target]
 
                 if delta_cost > unallocated_points:
-                    try:
-                        print(f"{Fore.RED}Not enough points ({unallocated_points} available, need {delta_cost}).{Style.RESET_ALL}")
-                    except OSError:
-                        print(f"Not enough points ({unallocated_points} available, need {delta_cost}).")
+                    _cprint(f"Not enough points ({unallocated_points} available, need {delta_cost}).", _RED)
                     continue
 
                 if delta_cost < 0 and abs(delta_cost) > point_pool - unallocated_points:
                     # Prevent “refund” exploits beyond originally allocated total
-                    try:
-                        print(f"{Fore.RED}Cannot remove more points than allocated.{Style.RESET_ALL}")
-                    except OSError:
-                        print("Cannot remove more points than allocated.")
+                    _cprint("Cannot remove more points than allocated.", _RED)
                     continue
 
                 stats[idx] = target
+                rows[idx] = render_row(idx)
                 unallocated_points -= delta_cost
-                logger.debug(f"Updated {stat_names[idx]} to {stats[idx]}, unallocated: {unallocated_points}")
+                logger.debug("Updated %s to %s, unallocated: %s", _STAT_ORDER[idx], stats[idx], unallocated_points)
 
             except ValueError:
-                try:
-                    print(f"{Fore.RED}Invalid input. Enter {min_stat}-{max_stat} or '+n'/'-n'.{Style.RESET_ALL}")
-                except OSError:
-                    print(f"Invalid input. Enter {min_stat}-{max_stat} or '+n'/'-n'.")
+                _cprint(f"Invalid input. Enter {min_stat}-{max_stat} or '+n'/'-n'.", _RED)
 
     # -------------------------------------------------------------------------
     # Render helper for "STR: +2, DEX: -1" style strings
@@ -887,84 +1024,51 @@ class PlayerManager:
         Thanks to defaults, this is never an empty list.
         """
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Select Your Race ==={Style.RESET_ALL}")
-                for i, race in enumerate(self.races, 1):
-                    print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}{i}. {race['name']}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {race.get('description', '')}{Style.RESET_ALL}")
-                    mods = race.get("ability_modifiers", {})
-                    mod_str = self._format_modifiers(mods)
-                    print(f"{Fore.CYAN}     Stat Modifiers: {mod_str or 'None'}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                sel = input(f"{Fore.YELLOW}Select race (1-{len(self.races)}): {Style.RESET_ALL}").strip()
-            except OSError:
-                print("=== Select Your Race ===")
-                for i, race in enumerate(self.races, 1):
-                    print("----------------------------------------")
-                    print(f"{i}. {race['name']}")
-                    print(f"     {race.get('description', '')}")
-                    mods = race.get("ability_modifiers", {})
-                    mod_str = self._format_modifiers(mods)
-                    print(f"     Stat Modifiers: {mod_str or 'None'}")
-                print("----------------------------------------")
-                sel = input(f"Select race (1-{len(self.races)}): ").strip()
-
-            logger.debug(f"Selected race: {sel}")
+            _cprint(self._race_menu)
+            sel = _cinput(f"Select race (1-{len(self.races)}): ").strip()
+
+            logger.debug("Selected race: %s", sel)
             if sel.isdigit():
                 idx = int(sel) - 1
                 if 0 <= idx < len(self.races):
                     return self.races[idx]["name"]
 
-            try:
-                print(f"{Fore.RED}Invalid race. Enter a number (1-{len(self.races)}).{Style.RESET_ALL}")
-            except OSError:
-                print(f"Invalid race. Enter a number (1-{len(self.races)}).")
+            _cprint(f"Invalid race. Enter a number (1-{len(self.races)}).", _RED)
 
     def _select_subrace(self, race: str) -> Optional[str]:
         """
         If the chosen race has subraces, present them; otherwise return None.
         """
-        race_dict = next((r for r in self.races if r["name"].lower() == race.lower()), None)
+        race_dict = self._race_dict(race)
         subraces = race_dict.get("subraces", {}) if race_dict else {}
         if not subraces:
             return None
 
         items = list(subraces.items())
+        # Render the menu once; an invalid entry only re-shows it.
+        lines = ["=== Select Your Subrace ==="]
+        for i, (sub_name, sub_data) in enumerate(items, 1):
+            mod_str = self._format_modifiers(sub_data.get("ability_modifiers", {}))
+            lines += (
+                _RULE,
+                f"{i}. {sub_name}",
+                f"     {sub_data.get('description', '')}",
+                f"     Stat Modifiers: {mod_str or 'None'}",
+            )
+        lines.append(_RULE)
+        menu = "\n".join(lines)
+
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Select Your Subrace ==={Style.RESET_ALL}")
-                for i, (sub_name, sub_data) in enumerate(items, 1):
-                    print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}{i}. {sub_name}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {sub_data.get('description', '')}{Style.RESET_ALL}")
-                    mods = sub_data.get("ability_modifiers", {})
-                    mod_str = self._format_modifiers(mods)
-                    print(f"{Fore.CYAN}     Stat Modifiers: {mod_str or 'None'}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                sel = input(f"{Fore.YELLOW}Select subrace (1-{len(items)}): {Style.RESET_ALL}").strip()
-            except OSError:
-                print("=== Select Your Subrace ===")
-                for i, (sub_name, sub_data) in enumerate(items, 1):
-                    print("----------------------------------------")
-                    print(f"{i}. {sub_name}")
-                    print(f"     {sub_data.get('description', '')}")
-                    mods = sub_data.get("ability_modifiers", {})
-                    mod_str = self._format_modifiers(mods)
-                    print(f"     Stat Modifiers: {mod_str or 'None'}")
-                print("----------------------------------------")
-                sel = input(f"Select subrace (1-{len(items)}): ").strip()
-
-            logger.debug(f"Selected subrace: {sel}")
+            _cprint(menu)
+            sel = _cinput(f"Select subrace (1-{len(items)}): ").strip()
+
+            logger.debug("Selected subrace: %s", sel)
             if sel.isdigit():
                 idx = int(sel) - 1
                 if 0 <= idx < len(items):
                     return items[idx][0]
 
-            try:
-                print(f"{Fore.RED}Invalid subrace. Enter a number (1-{len(items)}).{Style.RESET_ALL}")
-            except OSError:
-                print(f"Invalid subrace. Enter a number (1-{len(items)}).")
+            _cprint(f"Invalid subrace. Enter a number (1-{len(items)}).", _RED)
 
     # -------------------------------------------------------------------------
     # Class selection (data from game.classes)
@@ -976,56 +1080,83 @@ class PlayerManager:
         logger.debug("Starting class selection")
         classes = game.classes
 
-        preferred = {
-            "Barbarian": "Strength",
-            "Bard": "Charisma",
-            "Cleric": "Wisdom",
-            "Druid": "Wisdom",
-            "Fighter": "Strength",
-            "Monk": "Dexterity",
-            "Paladin": "Charisma",
-            "Ranger": "Dexterity",
-            "Rogue": "Dexterity",
-            "Sorcerer": "Charisma",
-            "Wizard": "Intelligence",
-            "Assassin": "Dexterity",
-        }
-
         items = list(classes.items())
+        menus = self._class_cache(game, "menus")
+        menu = menus.get("class")
+        if menu is None:
+            lines = ["=== Select Your Class ==="]
+            for i, (name, data) in enumerate(items, 1):
+                lines += (
+                    _RULE,
+                    f"{i}. {name}",
+                    f"     {data.get('description', '')}",
+                    f"     Preferred Stat: {_PREFERRED_STAT.get(name, 'Unknown')}",
+                )
+            lines.append(_RULE)
+            menu = menus["class"] = "\n".join(lines)
+
         while True:
-            try:
-                print(f"{Fore.CYAN}=== Select Your Class ==={Style.RESET_ALL}")
-                for i, (name, data) in enumerate(items, 1):
-                    print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}{i}. {name}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     {data.get('description', '')}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     Preferred Stat: {preferred.get(name, 'Unknown')}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-                sel = input(f"{Fore.YELLOW}Select class (1-{len(items)}): {Style.RESET_ALL}").strip()
-            except OSError:
-                print("=== Select Your Class ===")
-                for i, (name, data) in enumerate(items, 1):
-                    print("----------------------------------------")
-                    print(f"{i}. {name}")
-                    print(f"     {data.get('description', '')}")
-                    print(f"     Preferred Stat: {preferred.get(name, 'Unknown')}")
-                print("----------------------------------------")
-                sel = input(f"Select class (1-{len(items)}): ").strip()
-
-            logger.debug(f"Selected class: {sel}")
+            _cprint(menu)
+            sel = _cinput(f"Select class (1-{len(items)}): ").strip()
+
+            logger.debug("Selected class: %s", sel)
             if sel.isdigit():
                 idx = int(sel) - 1
                 if 0 <= idx < len(items):
                     return items[idx][0]
 
-            try:
-                print(f"{Fore.RED}Invalid class. Enter a number (1-{len(items)}).{Style.RESET_ALL}")
-            except OSError:
-                print(f"Invalid class. Enter a number (1-{len(items)}).")
+            _cprint(f"Invalid class. Enter a number (1-{len(items)}).", _RED)
 
     # -------------------------------------------------------------------------
     # Spell selection (optional; driven by class metadata or spells.json)
     # -------------------------------------------------------------------------
+    def _class_cache(self, game: Any, kind: str) -> Dict[str, Any]:
+        """
+        Per-class memo for data derived from game.classes (features, spell
+        pools). Class metadata does not change during a session; the memo is
+        dropped if a game brings a different classes dict.
+        """
+        if self._cached_classes is not game.classes:
+            self._cached_classes = game.classes
+            self._class_caches = {}
+        return self._class_caches.setdefault(kind, {})
+
+    def _subclass_requirements(
+        self, game: Any, character_class: str
+    ) -> List[Tuple[str, str, int, Dict[str, int], Optional[Tuple[Tuple[int, int], ...]]]]:
+        """
+        (name, description, level req, stat reqs, minimum stats) per subclass,
+        for the summary screen. Minimum stats are (index into _STAT_ORDER,
+        required score) pairs; None if a requirement names an unknown ability
+        that the default score (10) cannot meet.
+        """
+        cache = self._class_cache(game, "subclass_reqs")
+        reqs = cache.get(character_class)
+        if reqs is None:
+            reqs = []
+            subclasses = game.classes.get(character_class, {}).get("subclasses", {})
+            for sc_name, data in subclasses.items():
+                prereqs = data.get("prerequisites", {})
+                stat_reqs = prereqs.get("stats", {})
+                min_stats: Optional[Tuple[Tuple[int, int], ...]] = tuple(
+                    (_STAT_IDX[stat], v) for stat, v in stat_reqs.items() if stat in _STAT_IDX
+                )
+                if any(10 < v for stat, v in stat_reqs.items() if stat not in _STAT_IDX):
+                    min_stats = None
+                reqs.append((sc_name, data.get("description", ""), prereqs.get("level", 1), stat_reqs, min_stats))
+            cache[character_class] = reqs
+        return reqs
+
+    def _available_spells(self, game: Any, character_class: str) -> Dict[str, List[Any]]:
+        """Spell pool by level ("0", "1") for a class: spells.json first, then built-ins."""
+        cache = self._class_cache(game, "spells")
+        available = cache.get(character_class)
+        if available is None:
+            external = _safe_load_json(_data_path("spells.json"), {})
+            available = external.get(character_class, _DEFAULT_SPELLS.get(character_class, {}))
+            cache[character_class] = available
+        return available
+
     def _select_spells(self, game: Any, character_class: str) -> Dict[int, List[str]]:
         """
         Select level-0 (cantrips) and level-1 spells if the class can cast.
@@ -1037,62 +1168,13 @@ class PlayerManager:
         spells: Dict[int, List[str]] = {0: [], 1: []}
 
         if not class_data.get("spellcasting"):
-            logger.debug(f"No spells for non-spellcasting class: {character_class}")
+            logger.debug("No spells for non-spellcasting class: %s", character_class)
             return spells
 
-        # Try external spells.json
-        package_root = _pkg_root()
-        data_dir = os.path.join(package_root, "data")
-        spells_path = os.path.join(data_dir, "spells.json")
-        external = _safe_load_json(spells_path, {})
-
-        # Minimal built-ins if external is missing or empty for this class
-        default_spells = {
-            "Assassin": {
-                "0": [],
-                "1": [
-                    {"name": "Disguise Self", "description": "Change your appearance.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                    {"name": "Silent Image", "description": "Create an illusion.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                    {"name": "Ghost Sound", "description": "Minor sounds or music.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                ],
-            },
-            "Wizard": {
-                "0": [
-                    {"name": "Prestidigitation", "description": "Minor tricks.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
-                    {"name": "Mage Hand", "description": "Move 5 lb. at range.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
-                    {"name": "Detect Magic", "description": "Sense magic.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
-                    {"name": "Light", "description": "Object glows.", "mp_cost": 1, "primary_stat": "Intelligence", "min_level": 0},
-                ],
-                "1": [
-                    {"name": "Magic Missile", "description": "Auto-hit force darts.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                    {"name": "Shield", "description": "+4 AC; block missiles.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                    {"name": "Charm Person", "description": "Turns target friendly.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                    {"name": "Burning Hands", "description": "Close cone fire.", "mp_cost": 2, "primary_stat": "Intelligence", "min_level": 1},
-                ],
-            },
-            "Cleric": {
-                "0": [
-                    {"name": "Guidance", "description": "+1 to next roll.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
-                    {"name": "Light", "description": "Object glows.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
-                    {"name": "Detect Magic", "description": "Sense magic.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
-                    {"name": "Create Water", "description": "Conjure clean water.", "mp_cost": 1, "primary_stat": "Wisdom", "min_level": 0},
-                ],
-                "1": [
-                    {"name": "Bless", "description": "+1 attacks; vs fear.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
-                    {"name": "Cure Light Wounds", "description": "Heal 1d8+1/level.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
-                    {"name": "Shield of Faith", "description": "+2 deflection.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
-                    {"name": "Command", "description": "1-round compulsion.", "mp_cost": 2, "primary_stat": "Wisdom", "min_level": 1},
-                ],
-            },
-        }
-
-        available = external.get(character_class, default_spells.get(character_class, {}))
+        available = self._available_spells(game, character_class)
         if not available:
             logger.warning(f"No spells defined for {character_class} in spells.json or defaults")
-            try:
-                print(f"{Fore.YELLOW}No spells available for {character_class} at level 1.{Style.RESET_ALL}")
-            except OSError:
-                print(f"No spells available for {character_class} at level 1.")
+            _cprint(f"No spells available for {character_class} at level 1.", _YELLOW)
             return spells
 
         for lvl in [0, 1]:
@@ -1100,75 +1182,57 @@ class PlayerManager:
             if not level_spells:
                 continue
 
+            # Pools mix bare names and spell dicts; normalize once to
+            # (name, description, mp cost) rows for display and selection.
+            rows: List[Tuple[str, Any, Any]] = [
+                (spell, "No description", "Unknown") if isinstance(spell, str)
+                else (spell.get("name", "Unknown"), spell.get("description", "No description"), spell.get("mp_cost", "Unknown"))
+                for spell in level_spells
+            ]
+
             max_spells = 4 if lvl == 0 else 2
-            try:
-                print(f"{Fore.CYAN}=== Select Level {lvl} Spells (Choose up to {max_spells}) ==={Style.RESET_ALL}")
-                for i, spell in enumerate(level_spells, 1):
-                    nm = spell if isinstance(spell, str) else spell.get("name", "Unknown")
-                    desc = spell.get("description", "No description") if isinstance(spell, dict) else "No description"
-                    mp = spell.get("mp_cost", "Unknown") if isinstance(spell, dict) else "Unknown"
-                    print(f"{Fore.CYAN}{i}. {nm}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     Description: {desc}{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}     MP Cost: {mp}{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}----------------------------------------{Style.RESET_ALL}")
-            except OSError:
-                print(f"=== Select Level {lvl} Spells (Choose up to {max_spells}) ===")
-                for i, spell in enumerate(level_spells, 1):
-                    nm = spell if isinstance(spell, str) else spell.get("name", "Unknown")
-                    desc = spell.get("description", "No description") if isinstance(spell, dict) else "No description"
-                    mp = spell.get("mp_cost", "Unknown") if isinstance(spell, dict) else "Unknown"
-                    print(f"{i}. {nm}")
-                    print(f"     Description: {desc}")
-                    print(f"     MP Cost: {mp}")
-                print("----------------------------------------")
+            lines = [f"=== Select Level {lvl} Spells (Choose up to {max_spells}) ==="]
+            for i, (nm, desc, mp) in enumerate(rows, 1):
+                lines += (f"{i}. {nm}", f"     Description: {desc}", f"     MP Cost: {mp}")
+            lines.append(_RULE)
+            _cprint("\n".join(lines))
+
+            # Lowercased name -> spell name, for case-insensitive entry by name.
+            by_name: Dict[str, str] = {}
+            for nm, _desc, _mp in rows:
+                by_name.setdefault(nm.lower(), nm)
 
             selected: List[str] = []
             while len(selected) < max_spells:
-                try:
-                    choice = input(
-                        f"{Fore.YELLOW}Select spell {len(selected)+1}/{max_spells} (number, name, or 'done'): {Style.RESET_ALL}"
-                    ).strip().lower()
-                except OSError:
-                    choice = input(
-                        f"Select spell {len(selected)+1}/{max_spells} (number, name, or 'done'): "
-                    ).strip().lower()
+                choice = _cinput(
+                    f"Select spell {len(selected)+1}/{max_spells} (number, name, or 'done'): "
+                ).strip().lower()
 
                 if choice == 'done' and selected:
                     break
 
                 if choice.isdigit():
                     idx = int(choice) - 1
-                    if 0 <= idx < len(level_spells):
-                        nm = level_spells[idx]["name"] if isinstance(level_spells[idx], dict) else level_spells[idx]
+                    if 0 <= idx < len(rows):
+                        nm = rows[idx][0]
                         if nm not in selected:
                             selected.append(nm)
-                            logger.debug(f"Selected spell: {nm}")
+                            logger.debug("Selected spell: %s", nm)
                         else:
-                            try:
-                                print(f"{Fore.RED}Spell already selected. Try again.{Style.RESET_ALL}")
-                            except OSError:
-                                print("Spell already selected. Try again.")
+                            _cprint("Spell already selected. Try again.", _RED)
                     else:
-                        try:
-                            print(f"{Fore.RED}Invalid number. Try again.{Style.RESET_ALL}")
-                        except OSError:
-                            print("Invalid number. Try again.")
+                        _cprint("Invalid number. Try again.", _RED)
                 else:
                     # name match (case-insensitive)
-                    for spell in level_spells:
-                        nm = spell["name"] if isinstance(spell, dict) else spell
-                        if nm.lower() == choice and nm not in selected:
-                            selected.append(nm)
-                            logger.debug(f"Selected spell: {nm}")
-                            break
+                    nm = by_name.get(choice)
+                    if nm is not None and nm not in selected:
+                        selected.append(nm)
+                        logger.debug("Selected spell: %s", nm)
                     else:
-                        try:
-                            print(f"{Fore.RED}Invalid or already selected spell. Try again.{Style.RESET_ALL}")
-                        except OSError:
-                            print("Invalid or already selected spell. Try again.")
+                        _cprint("Invalid or already selected spell. Try again.", _RED)
 
             spells[lvl] = selected
-            logger.debug(f"Selected spells for level {lvl}: {selected}")
+            logger.debug("Selected spells for level %s: %s", lvl, selected)
 
         return spells
 
@@ -1176,11 +1240,15 @@ class PlayerManager:
     # Level-1 features
     # -------------------------------------------------------------------------
     def _get_class_features(self, game: Any, character_class: str) -> List[str]:
-        classes = game.classes
-        class_data = classes.get(character_class, {})
-        feats = [f["name"] for f in class_data.get("features", []) if f.get("level", 1) == 1]
-        logger.debug(f"Selected features for {character_class}: {feats}")
-        return feats
+        cache = self._class_cache(game, "features")
+        feats = cache.get(character_class)
+        if feats is None:
+            class_data = game.classes.get(character_class, {})
+            feats = [f["name"] for f in class_data.get("features", []) if f.get("level", 1) == 1]
+            cache[character_class] = feats
+        logger.debug("Selected features for %s: %s", character_class, feats)
+        # The player keeps (and may extend) its own list; the cached one stays intact.
+        return list(feats)
 
      # -------------------------------------------------------------------------
     # Choose a starting room that actually exists
@@ -1194,8 +1262,14 @@ class PlayerManager:
 
         if game_world and hasattr(game_world, "starting_room_id"):
             room_id = game_world.starting_room_id
+            # Kept on the game as (world, room id, position); a new world or a
+            # moved starting room misses the cache and is parsed again.
+            cached = getattr(game, "_cached_start_pos", None)
+            if cached is not None and cached[0] is game_world and cached[1] == room_id:
+                return cached[2]
             try:
                 x, y = map(int, room_id.split(","))
+                game._cached_start_pos = (game_world, room_id, (x, y))
                 return x, y
             except Exception as e:
                 logger.error(f"Invalid starting_room_id format: '{room_id}': {e}")
@@ -1216,7 +1290,7 @@ class PlayerManager:
             rooms = game_world.rooms
 
             if isinstance(rooms, dict) and rooms:
-                logger.debug(f"GameWorld has {len(rooms)} rooms; looking for a dungeon to start in")
+                logger.debug("GameWorld has %s rooms; looking for a dungeon to start in", len(rooms))
 
                 dungeon_room_id = None
                 fallback_room_id = None
@@ -1238,7 +1312,7 @@ class PlayerManager:
                     try:
                         x_str, y_str = chosen_id.split(",")
                         x, y = int(x_str), int(y_str)
-                        logger.debug(f"Starting in GameWorld room {chosen_id} -> ({x}, {y})")
+                        logger.debug("Starting in GameWorld room %s -> (%s, %s)", chosen_id, x, y)
                         return x, y
                     except Exception as e:
                         logger.error(f"Invalid room_id format '{chosen_id}' in GameWorld.rooms: {e}")
@@ -1248,14 +1322,14 @@ class PlayerManager:
 
         # Dict-based: { "x,y": { "type": "...", ... }, ... }
         if isinstance(locations, dict) and locations:
-            logger.debug(f"Using dict-based locations ({len(locations)} entries)")
+            logger.debug("Using dict-based locations (%s entries)", len(locations))
 
             # Prefer a dungeon location
             for key, loc in locations.items():
                 if isinstance(loc, dict) and loc.get("type") == "dungeon":
                     try:
                         x, y = map(int, key.split(","))
-                        logger.debug(f"Starting at dungeon location {key} -> ({x}, {y})")
+                        logger.debug("Starting at dungeon location %s -> (%s, %s)", key, x, y)
                         return x, y
                     except Exception as e:
                         logger.error(f"Bad location key '{key}' in locations: {e}")
@@ -1264,21 +1338,21 @@ class PlayerManager:
             first_key = next(iter(locations.keys()))
             try:
                 x, y = map(int, first_key.split(","))
-                logger.debug(f"No dungeon found; starting at first location {first_key} -> ({x}, {y})")
+                logger.debug("No dungeon found; starting at first location %s -> (%s, %s)", first_key, x, y)
                 return x, y
             except Exception as e:
                 logger.error(f"Bad first location key '{first_key}' in locations: {e}")
 
         # List-based: [ { "x": ..., "y": ..., "type": ... }, ... ]
         if isinstance(locations, list) and locations:
-            logger.debug(f"Using list-based locations ({len(locations)} entries)")
+            logger.debug("Using list-based locations (%s entries)", len(locations))
 
             # Prefer dungeon
             for loc in locations:
                 if isinstance(loc, dict) and loc.get("type") == "dungeon":
                     x = int(loc.get("x", 0))
                     y = int(loc.get("y", 0))
-                    logger.debug(f"Starting at dungeon location ({x}, {y}) [list-based]")
+                    logger.debug("Starting at dungeon location (%s, %s) [list-based]", x, y)
                     return x, y
 
             # Otherwise: first entry
@@ -1286,7 +1360,7 @@ class PlayerManager:
             if isinstance(first, dict):
                 x = int(first.get("x", 0))
                 y = int(first.get("y", 0))
-                logger.debug(f"No dungeon found; starting at first list location ({x}, {y})")
+                logger.debug("No dungeon found; starting at first list location (%s, %s)", x, y)
                 return x, y
 
         # --- 3. Absolute last resort -------------------------------------------------
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import sys
 from typing import Optional, Dict, List, Any
 from .console_utils import console_print, console_input
 
@@ -12,14 +13,29 @@ class RaceManager:
         races_path = os.path.join(os.path.dirname(__file__), "..", "dnd_adventure", "data", "races.json")
         logger.debug(f"Loading races from {races_path}...")
         try:
-            with open(races_path, "r") as f:
-                self.races = json.load(f)
-            logger.debug(f"Loaded races: {self.races}")
+            with open(races_path, "rb") as f:
+                self.races = json.loads(f.read())
+            logger.debug("Loaded races: %s", self.races)
         except FileNotFoundError:
             logger.error(f"Races file not found at {races_path}")
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding races.json: {e}")
 
+        # Lowercase each race name once here so lookups never call .lower() on
+        # the stored names; the first entry wins on case-insensitive duplicates.
+        self._races_lc: Dict[str, Dict[str, Any]] = {}
+        for r in self.races:
+            r["name"] = sys.intern(r["name"])
+            self._races_lc.setdefault(sys.intern(r["name"].lower()), r)
+        # Exact (menu) name -> race, so names from select_race skip .lower() too.
+        self._races_exact: Dict[str, Dict[str, Any]] = {
+            r["name"]: self._races_lc[r["name"].lower()] for r in self.races
+        }
+
+    def _find_race(self, race: str) -> Optional[Dict[str, Any]]:
+        found = self._races_exact.get(race)
+        return found if found is not None else self._races_lc.get(race.lower())
+
     def select_race(self) -> Optional[str]:
         while True:
             console_print("=== Select Your Race ===", color="cyan")
@@ -41,7 +57,7 @@ class RaceManager:
             console_print(f"Invalid race selected. Please enter a number (1-{len(self.races)}).", color="red")
 
     def select_subrace(self, race: str) -> Optional[str]:
-        race_dict = next((r for r in self.races if r["name"].lower() == race.lower()), None)
+        race_dict = self._find_race(race)
         subraces = race_dict.get("subraces", {}) if race_dict else {}
         if not subraces:
             return None
@@ -67,7 +83,7 @@ class RaceManager:
             console_print(f"Invalid subrace selected. Please enter a number (1-{len(subrace_list)}).", color="red")
 
     def get_race_data(self, race: str) -> Dict:
-        return next((r for r in self.races if r["name"].lower() == race.lower()), {})
+        return self._find_race(race) or {}
 
     def format_modifiers(self, modifiers: Dict[str, int]) -> str:
         return ", ".join(f"{k}: {'+' if v > 0 else ''}{v}" for k, v in modifiers.items()) if modifiers else ""
\ No newline at end of file
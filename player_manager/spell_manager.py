@@ -2,7 +2,7 @@ import json
 import logging
 import os
 from typing import Dict, List, Any
-from .console_utils import console_print, console_input
+from .console_utils import console_print, console_input, console_flush
 
 logger = logging.getLogger(__name__)
 
@@ -87,9 +87,9 @@ class SpellManager:
         
         spells_path = os.path.join(os.path.dirname(__file__), "..", "dnd_adventure", "data", "spells.json")
         try:
-            with open(spells_path, "r") as f:
-                spell_data = json.load(f)
-            logger.debug(f"Loaded spells.json: {spell_data}")
+            with open(spells_path, "rb") as f:
+                spell_data = json.loads(f.read())
+            logger.debug("Loaded spells.json: %s", spell_data)
         except FileNotFoundError:
             logger.warning(f"Spells file not found at {spells_path}, using default spells")
             spell_data = {}
@@ -106,6 +106,7 @@ class SpellManager:
         if not available_spells:
             logger.warning(f"No spells available for {character_class} in defaults")
             console_print(f"No spells available for {character_class} at level {player_level}.", color="yellow")
+            console_flush()
             return spells
         
         logger.debug(f"Stat dict for spell selection: {stat_dict}")
@@ -172,4 +173,5 @@ class SpellManager:
             spells[level] = selected
             logger.debug(f"Selected spells for level {level}: {selected}")
         
+        console_flush()
         return spells
\ No newline at end of file
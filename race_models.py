@@ -1,11 +1,19 @@
 from typing import List, Dict, Optional
 
 class RacialTrait:
+    __slots__ = ("name", "description")
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
 
 class Race:
+    # Races are built once per session from races.json; slots keep them compact.
+    __slots__ = (
+        "name", "description", "ability_modifiers", "size", "speed",
+        "racial_traits", "favored_class", "languages", "subraces", "subrace",
+    )
+
     def __init__(
         self,
         name: str,
@@ -22,6 +22,25 @@ class SaveManager:
             logger.error(f"Failed to save game to {filename}: {e}")
             raise
 
+    def prefetch(self, filename: str) -> None:
+        """
+        Ask the OS to start reading a save file in the background, so a later
+        load_game() finds it in the page cache. No-op where posix_fadvise is
+        unavailable (e.g. Windows) or the file cannot be opened.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            fd = os.open(os.path.join(self.save_dir, filename), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def load_game(self, filename: str) -> Dict:
         """Load game data from a file."""
         try:
@@ -6,8 +6,10 @@ from dnd_adventure.races import Race
 
 logger = logging.getLogger(__name__)
 
+_STAT_NAMES = ("Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma")
+
 def roll_stats(race: Race, subrace: Optional[str], classes: Dict, class_name: str, subclass_name: Optional[str] = None, character_level: int = 1) -> Tuple[List[int], Dict[str, int]]:
-    stat_names = ["Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma"]
+    stat_names = _STAT_NAMES
     stats = []
     print(f"\n{Fore.CYAN}=== Rolling Stats (4d6, drop lowest) ==={Style.RESET_ALL}")
     logger.debug("Rolling stats")
@@ -36,14 +38,11 @@ def roll_stats(race: Race, subrace: Optional[str], classes: Dict, class_name: st
             print(f"{Fore.YELLOW}Subrace Bonuses ({subrace}): None{Style.RESET_ALL}")
     else:
         print(f"{Fore.YELLOW}Subrace Bonuses: None{Style.RESET_ALL}")
-    stat_indices = {name: i for i, name in enumerate(stat_names)}
-    modified_stats = stats.copy()
-    for stat, mod in racial_mods.items():
-        if stat in stat_indices:
-            modified_stats[stat_indices[stat]] += mod
-    for stat, mod in subrace_mods.items():
-        if stat in stat_indices:
-            modified_stats[stat_indices[stat]] += mod
+    modified_stats = [
+        base + racial_mods.get(name, 0) + subrace_mods.get(name, 0)
+        for base, name in zip(stats, stat_names)
+    ]
+    stat_dict = dict(zip(stat_names, modified_stats))
     dnd_class = classes.get(class_name)
     if dnd_class:
         print(f"{Fore.YELLOW}Class Bonuses ({class_name}):{Style.RESET_ALL}")
@@ -76,8 +75,7 @@ def roll_stats(race: Race, subrace: Optional[str], classes: Dict, class_name: st
                 stat_reqs = prereqs.get("stats", {})
                 can_access = character_level >= level_req
                 for stat, req in stat_reqs.items():
-                    stat_index = stat_indices.get(stat)
-                    if stat_index is None or modified_stats[stat_index] < req:
+                    if stat not in stat_dict or stat_dict[stat] < req:
                         can_access = False
                 status = Fore.GREEN + "Unlocked" if can_access else Fore.RED + "Locked"
                 print(f"  {subclass_name} ({status}{Style.RESET_ALL}): {subclass['description']}")
@@ -90,9 +88,8 @@ def roll_stats(race: Race, subrace: Optional[str], classes: Dict, class_name: st
     else:
         print(f"{Fore.YELLOW}Class Bonuses: None{Style.RESET_ALL}")
     print(f"\n{Fore.GREEN}=== Final Stats ==={Style.RESET_ALL}")
-    for i, stat in enumerate(modified_stats):
-        print(f"{stat_names[i]}: {stat}")
+    for name, stat in stat_dict.items():
+        print(f"{name}: {stat}")
     input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
-    stat_dict = {name: modified_stats[i] for i, name in enumerate(stat_names)}
     logger.debug(f"Stats rolled: {modified_stats}, Dict: {stat_dict}")
     return modified_stats, stat_dict
\ No newline at end of file
@@ -2,6 +2,15 @@
 import random
 from typing import List, Dict, Any
 
+# Small-talk lines for non-notable NPCs; one is picked, then formatted.
+_CHATTER_TEMPLATES = (
+    "The {race} folk of {civ} have been busy lately.",
+    "As a {profession}, I don't trust outsiders wandering these lands.",
+    "They say another storm is coming from the east.",
+    "Life in {civ} isn't easy, but we make do.",
+    "Rumors say heroes walk among us once again.",
+)
+
 def generate_dialogue(npcs: List[Dict[str, Any]], events: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     """
     Generate dialogue snippets for NPCs based on world events.
@@ -22,14 +31,9 @@ def generate_dialogue(npcs: List[Dict[str, Any]], events: List[Dict[str, Any]])
             topic = random.choice(event_topics) if event_topics else "Rumor"
             line = f"I once witnessed the great {topic.lower()} that changed {civ} forever!"
         else:
-            chatter = [
-                f"The {race.lower()} folk of {civ} have been busy lately.",
-                f"As a {profession.lower()}, I don't trust outsiders wandering these lands.",
-                f"They say another storm is coming from the east.",
-                f"Life in {civ} isn't easy, but we make do.",
-                f"Rumors say heroes walk among us once again.",
-            ]
-            line = random.choice(chatter)
+            line = random.choice(_CHATTER_TEMPLATES).format(
+                race=race.lower(), civ=civ, profession=profession.lower()
+            )
 
         dialogues.append({
             "speaker": name,
@@ -48,6 +48,11 @@ import random
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -112,8 +117,9 @@ def _ensure_dir(path: str) -> None:
 def _read_json(path: str, default):
     """Safe JSON loader – returns default on missing/invalid file."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         logger.warning(f"Missing {path} — using defaults.")
         return default
@@ -125,8 +131,12 @@ def _read_json(path: str, default):
 def _write_json(path: str, obj) -> None:
     """Safe JSON writer for debug/export helpers."""
     _ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
 
 
 # =============================================================================
@@ -31,14 +31,12 @@ def generate_npcs(civilizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Generate NPCs for each civilization based on race data.
     Creates unique NPCs with random professions, traits, and roles.
     """
-    races_data = load_races()
     npcs = []
     professions = ["Warrior", "Mage", "Hunter", "Merchant", "Scholar", "Farmer", "Priest", "Thief"]
     traits = ["Brave", "Cunning", "Kind", "Greedy", "Loyal", "Deceitful", "Curious", "Stoic"]
 
     for civ in civilizations:
         race_name = civ.get("race", "Human")
-        race_info = next((r for r in races_data if r["name"].lower() == race_name.lower()), None)
 
         for _ in range(random.randint(5, 15)):  # Number of NPCs per civ
             npc = {
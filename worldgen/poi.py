@@ -2,8 +2,10 @@
 Placement of towns, castles, and dungeons with spacing & biome rules.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
 import random
 
 @dataclass
@@ -15,12 +17,24 @@ class POI:
 def _manhattan(a: Tuple[int,int], b: Tuple[int,int]) -> int:
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
+def _distinct_cells(n: int, rng: random.Random) -> Iterator[int]:
+    """Yield cell indices in [0, n) in random order without repeats (lazy Fisher-Yates)."""
+    swapped: Dict[int, int] = {}
+    for i in range(n):
+        j = rng.randrange(i, n)
+        yield swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+
 def place_pois(bm: List[List[str]],
                counts: Dict[str,int],
                min_spacing: int,
                rng: random.Random) -> List[POI]:
     H = len(bm); W = len(bm[0]) if H else 0
     pois: List[POI] = []
+    # Placed POIs bucketed into min_spacing-sized squares: anything closer than
+    # min_spacing (Manhattan) must sit in the same or an adjacent bucket.
+    size = max(min_spacing, 1)
+    buckets: Dict[Tuple[int,int], List[POI]] = defaultdict(list)
 
     def can_place(kind: str, x: int, y: int) -> bool:
         b = bm[y][x]
@@ -30,17 +44,22 @@ def place_pois(bm: List[List[str]],
         elif kind == "dungeon":
             if b not in ("mountain","forest","grass"):
                 return False
-        for p in pois:
-            if _manhattan((p.x,p.y),(x,y)) < min_spacing:
-                return False
+        bx, by = x // size, y // size
+        for nx in (bx-1, bx, bx+1):
+            for ny in (by-1, by, by+1):
+                for p in buckets.get((nx,ny), ()):
+                    if _manhattan((p.x,p.y),(x,y)) < min_spacing:
+                        return False
         return True
 
     def spawn(kind: str, attempts: int):
-        for _ in range(attempts):
-            x = rng.randrange(W)
-            y = rng.randrange(H)
+        # Each attempt tests a new cell, so rejected cells are never re-drawn.
+        for cell in islice(_distinct_cells(W * H, rng), attempts):
+            y, x = divmod(cell, W)
             if can_place(kind, x, y):
-                pois.append(POI(x,y,kind))
+                poi = POI(x,y,kind)
+                pois.append(poi)
+                buckets[(x // size, y // size)].append(poi)
                 return
 
     for _ in range(counts.get("castles",0)):
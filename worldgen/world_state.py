@@ -261,15 +261,16 @@ class WorldState:
             self.timeline = record_timeline(self.events)
 
             # 8) Civ change tracker (for future dynamic updates)
-            self.civ_changes = []
-            for civ in self.civilizations:
-                self.civ_changes.append({
+            self.civ_changes = [
+                {
                     "name": civ.get("name", "Unknown"),
                     "race": civ.get("race"),
                     "subrace": civ.get("subrace"),
                     "power_change": 0,
                     "population_change": 0,
-                })
+                }
+                for civ in self.civilizations
+            ]
 
             logger.info("World generation complete for '%s'.", self.world_name)
 